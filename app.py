@@ -5,12 +5,75 @@ A Streamlit app for tracking and visualizing study productivity.
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, time, date
-from utils.scoring import calculate_total_index
+from pathlib import Path
+from datetime import time, date
+from utils.scoring import calculate_total_index, calculate_cognitive_roi
 from utils.db_data_manager import DataManager, UserConfigManager
 from utils.database import init_database
+from pages.Dashboard import show_dashboard, load_dashboard_data
+from ui.style_loader import load_css
+from config.settings import DEFAULT_BEDTIME, DEFAULT_WAKE_TIME
 
 
+# App shell stylesheet (hides the sidebar)
+APP_CSS_FILE = Path(__file__).parent / "assets" / "app.css"
+
+# Number of entries shown in Recent History
+RECENT_ENTRIES = 10
+
+# Entry form defaults: field -> (default value, type)
+FORM_DEFAULTS = {
+    'study_hours': (6.0, float),
+    'screen_time_minutes': (60, int),
+    'recall_percent': (80, int),
+    'sleep_hours': (7.5, float),
+    'diet_quality': (7, int),
+    'exercise_minutes': (45, int),
+    'sunlight_minutes': (30, int),
+}
+
+# Static widget arguments for the entry form
+STUDY_HOURS_KW = dict(
+    min_value=0.0,
+    max_value=24.0,
+    step=0.5,
+    help="Total hours spent studying"
+)
+SCREEN_TIME_MINUTES_KW = dict(
+    min_value=0,
+    max_value=1440,
+    step=15,
+    help="Leisure screen time (social media, entertainment)"
+)
+RECALL_PERCENT_KW = dict(
+    min_value=0,
+    max_value=100,
+    help="Percentage of material you can accurately recall"
+)
+SLEEP_HOURS_KW = dict(
+    min_value=0.0,
+    max_value=24.0,
+    step=0.5,
+    help="Total hours of sleep"
+)
+DIET_QUALITY_KW = dict(
+    min_value=0,
+    max_value=10,
+    help="Overall diet quality (0=poor, 10=excellent)"
+)
+EXERCISE_MINUTES_KW = dict(
+    min_value=0,
+    max_value=300,
+    step=5,
+    help="Total minutes of physical exercise"
+)
+SUNLIGHT_MINUTES_KW = dict(
+    min_value=0,
+    max_value=720,
+    step=5,
+    help="Minutes of outdoor sunlight exposure"
+)
+
 # Page configuration
 st.set_page_config(
     page_title="Neuro Index",
@@ -33,6 +96,70 @@ def setup_database():
 db_ready = setup_database()
 
 
+@st.cache_resource
+def get_data_manager():
+    """Create the data manager once and share it across reruns and sessions."""
+    return DataManager()
+
+
+@st.cache_resource
+def get_config_manager():
+    """Create the user config manager once and share it across reruns and sessions."""
+    return UserConfigManager()
+
+
+@st.cache_data
+def load_cached_recent(signature, n=10):
+    """
+    Load the n most recent entries, cached until the data signature changes.
+    
+    Args:
+        signature: Data fingerprint from DataManager.get_signature()
+        n: Number of entries to load
+    """
+    return get_data_manager().load_recent(n)
+
+
+@st.cache_data(show_spinner=False)
+def score_entry(study_hours, screen_time_minutes, recall_percent, sleep_hours,
+                bedtime, wake_time, diet_quality, exercise_minutes, sunlight_minutes):
+    """
+    Score an entry's inputs, cached on the (hashable scalar) input values.
+    
+    Returns:
+        Dictionary of component scores, penalties, total_index and cognitive_roi
+    """
+    scores = calculate_total_index(
+        study_hours=study_hours,
+        recall_percent=recall_percent,
+        sleep_hours=sleep_hours,
+        diet_quality=diet_quality,
+        exercise_minutes=exercise_minutes,
+        bedtime=bedtime,
+        wake_time=wake_time,
+        screen_time_minutes=screen_time_minutes,
+        sunlight_minutes=sunlight_minutes
+    )
+    cognitive_roi = calculate_cognitive_roi(recall_percent, study_hours)
+    return {**scores, 'cognitive_roi': round(cognitive_roi, 2)}
+
+
+def _parse_hms(value, default: time) -> time:
+    """
+    Convert a stored time to a time object without strptime.
+    
+    Args:
+        value: time object (database rows) or 'HH:MM:SS' string (CSV rows)
+        default: Fallback when the value is missing or malformed
+    """
+    if isinstance(value, time):
+        return value
+    try:
+        return time(int(value[0:2]), int(value[3:5]), int(value[6:8] or 0))
+    except (TypeError, ValueError):
+        return default
+
+
 def main():
     """Main application entry point."""
     
@@ -40,55 +167,42 @@ def main():
         st.error("⚠️ Database not connected. Please check DATABASE_URL environment variable.")
         st.stop()
     
-    # Initialize data manager
-    data_manager = DataManager()
-    config_manager = UserConfigManager()
-    
     # Initialize session state for view toggle
     if 'view_mode' not in st.session_state:
         st.session_state.view_mode = 'entry'
     
     # Custom CSS to hide sidebar completely
-    st.markdown("""
-        <style>
-        /* Hide sidebar completely */
-        [data-testid="stSidebar"] {
-            display: none;
-        }
-        section[data-testid="stSidebar"] {
-            display: none;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    load_css(APP_CSS_FILE)
     
     # Title
     st.title("🧠 Neuro Index")
     
-    # Toggle between Entry and Dashboard with styled buttons
+    # Toggle between Entry and Dashboard (widget state drives the rerun itself)
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
-        # Create two buttons for toggle
-        col_entry, col_dash = st.columns(2)
-        with col_entry:
-            if st.button("📝 Entry", key="entry_btn", use_container_width=True, 
-                        type="primary" if st.session_state.view_mode == 'entry' else "secondary"):
-                st.session_state.view_mode = 'entry'
-                st.rerun()
-        with col_dash:
-            if st.button("📊 Dashboard", key="dash_btn", use_container_width=True,
-                        type="primary" if st.session_state.view_mode == 'dashboard' else "secondary"):
-                st.session_state.view_mode = 'dashboard'
-                st.rerun()
+        st.segmented_control(
+            "View",
+            options=['entry', 'dashboard'],
+            format_func={'entry': "📝 Entry", 'dashboard': "📊 Dashboard"}.get,
+            key="view_mode",
+            required=True,  # clicking the active view must not deselect it
+            label_visibility="collapsed"
+        )
     
     st.divider()
     
     # Show different content based on toggle
     if st.session_state.view_mode == 'dashboard':
-        # Import and run dashboard
-        from pages.Dashboard import show_dashboard
-        show_dashboard()
+        show_dashboard(get_data_manager())
         return
     
+    # Get shared data managers (stateless: each call opens its own DB session)
+    data_manager = get_data_manager()
+    config_manager = get_config_manager()
+    
+    # Load recent entries once; reused for the date lookup and the history table
+    df = load_cached_recent(data_manager.get_signature(), RECENT_ENTRIES)
+    
     # Entry mode - centered form (no sidebar)
     st.markdown("### Productivity-First Tracking System")
     
@@ -98,182 +212,164 @@ def main():
     with col_center:
         st.header("📊 Daily Log Entry")
         
+        # Cycle info only changes when settings are saved or the day rolls
+        # over, so keep it in session state instead of querying every rerun
+        today = date.today()
+        cycle_info = st.session_state.get('cycle_info')
+        if cycle_info is None or cycle_info[0] != today:
+            current_period_date = config_manager.get_last_period_date()
+            cycle_day = config_manager.calculate_cycle_day(today)
+            cycle_phase = config_manager.get_cycle_phase(cycle_day)
+            st.session_state.cycle_info = (today, current_period_date, cycle_day, cycle_phase)
+        else:
+            _, current_period_date, cycle_day, cycle_phase = cycle_info
+        
         # User Settings Section
         with st.expander("⚙️ User Settings", expanded=False):
             st.markdown("**Cycle Tracking Configuration**")
             
-            current_period_date = config_manager.get_last_period_date()
-            period_date_input = st.date_input(
-                "Last Period Start Date",
-                value=current_period_date if current_period_date else date.today(),
-                help="Date of your last period start - used to auto-calculate cycle day"
-            )
+            # Form: picking a date doesn't rerun the app until it's saved
+            with st.form("user_settings", border=False):
+                period_date_input = st.date_input(
+                    "Last Period Start Date",
+                    value=current_period_date if current_period_date else today,
+                    help="Date of your last period start - used to auto-calculate cycle day"
+                )
+                
+                settings_saved = st.form_submit_button("💾 Save Settings", use_container_width=True)
             
-            if st.button("💾 Save Settings", use_container_width=True):
+            if settings_saved:
                 config_manager.set_last_period_date(period_date_input)
+                current_period_date = period_date_input
+                cycle_day = config_manager.calculate_cycle_day(today)
+                cycle_phase = config_manager.get_cycle_phase(cycle_day)
+                st.session_state.cycle_info = (today, current_period_date, cycle_day, cycle_phase)
                 st.success("✅ Settings saved!")
-                st.rerun()
-        
-        # Calculate current cycle day
-        cycle_day = config_manager.calculate_cycle_day()
-        cycle_phase = config_manager.get_cycle_phase(cycle_day)
         
         # Display cycle info
         st.info(f"🌙 **Cycle Day:** {cycle_day} - {cycle_phase}")
         
-        # Date selector OUTSIDE the form for reactivity
-        entry_date = st.date_input(
-            "📅 Entry Date",
-            value=date.today(),
-            max_value=date.today(),
-            help="Select today or a past date to add/edit entry"
-        )
+        # Date selector in its own form: browsing the calendar doesn't rerun,
+        # the selected date is only applied on "Load Date"
+        with st.form("date_selector"):
+            picked_date = st.date_input(
+                "📅 Entry Date",
+                value=st.session_state.get('active_date', today),
+                max_value=today,
+                help="Select today or a past date to add/edit entry"
+            )
+            if st.form_submit_button("📅 Load Date", use_container_width=True):
+                st.session_state.active_date = picked_date
         
-        # Load existing data for selected date
-        existing_data = data_manager.load_data()
-        existing_entry = None
-        if not existing_data.empty:
-            date_str = entry_date.strftime('%Y-%m-%d')
-            if 'date' in existing_data.columns:
-                existing_data['date'] = pd.to_datetime(existing_data['date']).dt.strftime('%Y-%m-%d')
-                match = existing_data[existing_data['date'] == date_str]
-                if not match.empty:
-                    existing_entry = match.iloc[0].to_dict()
-                    st.success(f"📝 Editing existing entry for {entry_date.strftime('%b %d, %Y')}")
+        entry_date = st.session_state.get('active_date', today)
         
-        # Set default values (from existing entry or defaults)
-        def get_val(key, default, dtype=float):
-            if existing_entry and key in existing_entry:
-                val = existing_entry[key]
-                if pd.notna(val):
-                    return dtype(val)
-            return default
+        # Load existing entry for selected date, only when the date changes
+        # (only dates older than the recent window need their own query)
+        if st.session_state.get('existing_entry_date') != entry_date:
+            entry_ts = pd.Timestamp(entry_date)
+            match = df[df['date'] == entry_ts] if not df.empty else df
+            if not match.empty:
+                existing_entry = match.iloc[0].to_dict()
+            elif len(df) == RECENT_ENTRIES and entry_ts < df['date'].min():
+                existing_entry = data_manager.get_entry_by_date(entry_date)
+            else:
+                existing_entry = None
+            st.session_state.existing_entry_date = entry_date
+            st.session_state.existing_entry = existing_entry
+        existing_entry = st.session_state.existing_entry
+        if existing_entry:
+            st.success(f"📝 Editing existing entry for {entry_date.strftime('%b %d, %Y')}")
+        
+        # Seed the keyed form widgets (from existing entry or defaults) only
+        # when the date changes or their state was dropped (e.g. after the
+        # dashboard view), so values stay put across reruns and saves
+        if (st.session_state.get('form_date') != entry_date
+                or 'entry_study_hours' not in st.session_state):
+            entry_values = existing_entry or {}
+            for key, (default, dtype) in FORM_DEFAULTS.items():
+                value = entry_values.get(key)
+                st.session_state[f"entry_{key}"] = dtype(value) if pd.notna(value) else default
+            st.session_state.entry_bedtime = _parse_hms(entry_values.get('bedtime'), DEFAULT_BEDTIME)
+            st.session_state.entry_wake_time = _parse_hms(entry_values.get('wake_time'), DEFAULT_WAKE_TIME)
+            st.session_state.form_date = entry_date
         
         with st.form("daily_entry"):
             st.subheader("Study Data")
             study_hours = st.number_input(
                 "Study Hours",
-                min_value=0.0,
-                max_value=24.0,
-                value=get_val('study_hours', 6.0),
-                step=0.5,
-                help="Total hours spent studying"
+                key="entry_study_hours",
+                **STUDY_HOURS_KW
             )
             
             screen_time_minutes = st.number_input(
                 "Screen Time (minutes)",
-                min_value=0,
-                max_value=1440,
-                value=get_val('screen_time_minutes', 60, int),
-                step=15,
-                help="Leisure screen time (social media, entertainment)"
+                key="entry_screen_time_minutes",
+                **SCREEN_TIME_MINUTES_KW
             )
             
             recall_percent = st.slider(
                 "Recall Accuracy (%)",
-                min_value=0,
-                max_value=100,
-                value=get_val('recall_percent', 80, int),
-                help="Percentage of material you can accurately recall"
+                key="entry_recall_percent",
+                **RECALL_PERCENT_KW
             )
             
             st.subheader("Physical Data")
             
             sleep_hours = st.number_input(
                 "Sleep Hours",
-                min_value=0.0,
-                max_value=24.0,
-                value=get_val('sleep_hours', 7.5),
-                step=0.5,
-                help="Total hours of sleep"
+                key="entry_sleep_hours",
+                **SLEEP_HOURS_KW
             )
             
             col1, col2 = st.columns(2)
             with col1:
-                # Parse existing bedtime if available
-                default_bedtime = time(22, 30)
-                if existing_entry and 'bedtime' in existing_entry and pd.notna(existing_entry['bedtime']):
-                    try:
-                        bt = existing_entry['bedtime']
-                        if isinstance(bt, str):
-                            default_bedtime = datetime.strptime(bt, '%H:%M:%S').time()
-                    except:
-                        pass
                 bedtime = st.time_input(
                     "Bedtime",
-                    value=default_bedtime,
+                    key="entry_bedtime",
                     help="Time you went to bed"
                 )
             
             with col2:
-                # Parse existing wake_time if available
-                default_wake = time(6, 0)
-                if existing_entry and 'wake_time' in existing_entry and pd.notna(existing_entry['wake_time']):
-                    try:
-                        wt = existing_entry['wake_time']
-                        if isinstance(wt, str):
-                            default_wake = datetime.strptime(wt, '%H:%M:%S').time()
-                    except:
-                        pass
                 wake_time = st.time_input(
                     "Wake Time",
-                    value=default_wake,
+                    key="entry_wake_time",
                     help="Time you woke up"
                 )
             
             diet_quality = st.slider(
                 "Diet Quality",
-                min_value=0,
-                max_value=10,
-                value=get_val('diet_quality', 7, int),
-                help="Overall diet quality (0=poor, 10=excellent)"
+                key="entry_diet_quality",
+                **DIET_QUALITY_KW
             )
             
             col3, col4 = st.columns(2)
             with col3:
                 exercise_minutes = st.number_input(
                     "Exercise (minutes)",
-                    min_value=0,
-                    max_value=300,
-                    value=get_val('exercise_minutes', 45, int),
-                    step=5,
-                    help="Total minutes of physical exercise"
+                    key="entry_exercise_minutes",
+                    **EXERCISE_MINUTES_KW
                 )
             
             with col4:
                 sunlight_minutes = st.number_input(
                     "Sunlight Exposure (minutes)",
-                    min_value=0,
-                    max_value=720,
-                    value=get_val('sunlight_minutes', 30, int),
-                    step=5,
-                    help="Minutes of outdoor sunlight exposure"
+                    key="entry_sunlight_minutes",
+                    **SUNLIGHT_MINUTES_KW
                 )
             
             # Submit button
             submitted = st.form_submit_button("💾 Save Entry", use_container_width=True)
             
             if submitted:
-                # Calculate scores
-                scores = calculate_total_index(
-                    study_hours=study_hours,
-                    recall_percent=recall_percent,
-                    sleep_hours=sleep_hours,
-                    diet_quality=diet_quality,
-                    exercise_minutes=exercise_minutes,
-                    bedtime=bedtime,
-                    wake_time=wake_time,
-                    screen_time_minutes=screen_time_minutes,
-                    sunlight_minutes=sunlight_minutes
+                # Calculate scores and cognitive ROI
+                scores = score_entry(
+                    study_hours, screen_time_minutes, recall_percent, sleep_hours,
+                    bedtime, wake_time, diet_quality, exercise_minutes, sunlight_minutes
                 )
                 
-                # Calculate cognitive ROI
-                from utils.scoring import calculate_cognitive_roi
-                cognitive_roi = calculate_cognitive_roi(recall_percent, study_hours)
-                
                 # Prepare entry
                 entry = {
-                    'date': datetime.combine(entry_date, datetime.min.time()),
+                    'date': pd.Timestamp(entry_date),
                     'study_hours': study_hours,
                     'screen_time_minutes': screen_time_minutes,
                     'recall_percent': recall_percent,
@@ -284,21 +380,27 @@ def main():
                     'exercise_minutes': exercise_minutes,
                     'sunlight_minutes': sunlight_minutes,
                     'cycle_day': cycle_day,
-                    'cognitive_roi': round(cognitive_roi, 2),
                     **scores
                 }
                 
                 # Save entry
                 data_manager.save_entry(entry)
+                load_cached_recent.clear()
+                load_dashboard_data.clear()
+                st.session_state.pop('existing_entry_date', None)
                 st.success(f"✅ Entry saved! Total Index: {scores['total_index']}/100")
-                st.rerun()
+                
+                # Fold the saved entry into the recent entries rendered below
+                # instead of re-querying them in this same run
+                new_row = pd.DataFrame([entry])
+                if not df.empty:
+                    new_row = pd.concat([new_row, df[df['date'] != entry['date']]], ignore_index=True)
+                df = new_row.sort_values('date', ascending=False, ignore_index=True).head(RECENT_ENTRIES)
     
     # Recent entries section
     st.divider()
     st.subheader("📋 Recent Entries")
     
-    df = data_manager.load_data()
-    
     if df.empty:
         st.info("👆 Start by entering your daily metrics above!")
         st.markdown("""
@@ -313,60 +415,31 @@ def main():
         Navigate to the **Dashboard** page to see visualizations once you have some data.
         """)
     else:
-        # Display latest stats
-        latest = df.iloc[0]
+        # Display latest stats (read once into a plain dict)
+        latest = df.head(1).to_dict('records')[0]
         
         st.header("📈 Latest Entry")
         st.markdown(f"**Date:** {latest['date'].strftime('%Y-%m-%d')}")
         
-        # Score display
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric(
-                "Total Index",
-                f"{latest['total_index']}/100",
-                help="Overall productivity score"
-            )
-        
-        with col2:
-            st.metric(
-                "Study Score",
-                f"{latest['study_score']}/30",
-                help="Points from study hours"
-            )
-        
-        with col3:
-            st.metric(
-                "Recall Score",
-                f"{latest['recall_score']}/20",
-                help="Points from recall accuracy"
-            )
-        
-        # Component breakdown
-        st.subheader("Component Breakdown")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Sleep Score", f"{latest['sleep_score']}/20")
-        
-        with col2:
-            st.metric("Diet Score", f"{latest['diet_score']}/20")
-        
-        with col3:
-            st.metric("Exercise Score", f"{latest['exercise_score']}/10")
+        # Score display and component breakdown in a single row
+        total_penalties = latest['circadian_penalty'] + latest['distraction_penalty']
+        metrics = [
+            ("Total Index", f"{latest['total_index']}/100", None, "Overall productivity score"),
+            ("Study Score", f"{latest['study_score']}/30", None, "Points from study hours"),
+            ("Recall Score", f"{latest['recall_score']}/20", None, "Points from recall accuracy"),
+            ("Sleep Score", f"{latest['sleep_score']}/20", None, None),
+            ("Diet Score", f"{latest['diet_score']}/20", None, None),
+            ("Exercise Score", f"{latest['exercise_score']}/10", None, None),
+            ("Penalties", f"{total_penalties}", f"{total_penalties}", None),
+        ]
         
-        with col4:
-            total_penalties = latest['circadian_penalty'] + latest['distraction_penalty']
-            st.metric("Penalties", f"{total_penalties}", delta=f"{total_penalties}")
+        for col, (label, value, delta, help_text) in zip(st.columns(len(metrics)), metrics):
+            with col:
+                st.metric(label, value, delta=delta, help=help_text)
         
         # Recent history
         st.subheader("Recent History")
         
-        display_df = df.head(10).copy()
-        display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-        
         # Select columns to display
         display_cols = [
             'date',
@@ -378,10 +451,12 @@ def main():
             'distraction_penalty'
         ]
         
+        # Dates are formatted by the frontend, not with a Python-level strftime
         st.dataframe(
-            display_df[display_cols],
+            df[display_cols],
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={'date': st.column_config.DateColumn("date", format="YYYY-MM-DD")}
         )
 
 
@@ -5,7 +5,9 @@ Central configuration file for all constants, theme colors, file paths, and scor
 """
 
 import os
+from datetime import time
 from pathlib import Path
+from types import MappingProxyType
 
 # ==================== PROJECT PATHS ====================
 # Base directory of the project
@@ -19,7 +21,8 @@ ASSETS_DIR = BASE_DIR / "assets"
 DATA_DIR.mkdir(exist_ok=True)
 
 # Database/CSV file paths
-DAILY_LOG_FILE = DATA_DIR / "daily_logs.csv"
+DAILY_LOG_FILE = DATA_DIR / "daily_logs.parquet"
+LEGACY_DAILY_LOG_FILE = DATA_DIR / "daily_logs.csv"  # Migrated to Parquet on first load
 PVT_RESULTS_FILE = DATA_DIR / "pvt_results.csv"
 ANALYTICS_FILE = DATA_DIR / "analytics.csv"
 
@@ -33,15 +36,21 @@ CYBER_CYAN = "#00F0FF"
 DARK_GRAY = "#1A1A2E"
 ACCENT_PINK = "#FF006E"
 
-# Color palette dictionary for easy access
-THEME_COLORS = {
+# Color palette dictionary for easy access (read-only, shared by all importers)
+THEME_COLORS = MappingProxyType({
     "primary": NEON_GREEN,
     "background": DEEP_BLUE,
     "secondary": ELECTRIC_PURPLE,
     "accent": CYBER_CYAN,
     "dark": DARK_GRAY,
     "highlight": ACCENT_PINK
-}
+})
+
+# Same palette as (r, g, b) tuples, parsed once for rgba() strings
+THEME_RGB = MappingProxyType({
+    name: tuple(int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    for name, hex_color in THEME_COLORS.items()
+})
 
 
 # ==================== SCORING & METRICS ====================
@@ -93,6 +102,12 @@ PAGE_CONFIG = {
 }
 
 
+# ==================== ENTRY FORM DEFAULTS ====================
+# Default bed/wake times for a new entry
+DEFAULT_BEDTIME = time(22, 30)
+DEFAULT_WAKE_TIME = time(6, 0)
+
+
 # ==================== DATA VALIDATION ====================
 REQUIRED_COLUMNS = [
     "date",
@@ -0,0 +1 @@
+# Modules package
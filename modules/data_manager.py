@@ -1,7 +1,7 @@
 """
 UPSC Neuro-OS Data Persistence Layer
 =====================================
-Handles all data storage, retrieval, and CSV operations.
+Handles all data storage, retrieval, and Parquet/CSV file operations.
 Separates data logic from UI and business logic.
 
 Author: Senior Python Software Architect
@@ -10,16 +10,21 @@ Date: November 29, 2025
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from dataclasses import dataclass, asdict, fields, MISSING
 import json
+import atexit
+import queue
+import threading
 
 # Import project settings
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 from config.settings import (
     DAILY_LOG_FILE, 
+    LEGACY_DAILY_LOG_FILE,
     PVT_RESULTS_FILE, 
     ANALYTICS_FILE,
     REQUIRED_COLUMNS,
@@ -28,12 +33,390 @@ from config.settings import (
 )
 
 
+# Schema for daily logs
+# Numeric columns use the narrowest type that fits their range: 0-10 sliders
+# and percentages as Int8, minutes/milliseconds/index as Int16 (nullable, as
+# entries may leave them blank). Measurements the user types in (hours,
+# litres) stay float64 so values like 7.3 read back exactly. Text columns hold
+# few distinct values (HH:MM times, repeated notes), so they are categorical.
+DAILY_LOG_SCHEMA = {
+    'date': 'datetime64[ns]',
+    'sleep_hours': 'float64',
+    'sleep_quality': 'Int8',
+    'bedtime': 'category',
+    'wake_time': 'category',
+    'study_hours': 'float64',
+    'exercise_minutes': 'Int16',
+    'meditation_minutes': 'Int16',
+    'diet_quality': 'Int8',
+    'recall_percent': 'Int8',
+    'pvt_avg_ms': 'Int16',
+    'mood': 'Int8',
+    'focus_score': 'Int8',
+    'energy_level': 'Int8',
+    'stress_level': 'Int8',
+    'water_intake_liters': 'float64',
+    'screen_time_hours': 'float64',
+    'notes': 'category',
+    'total_index': 'Int16'
+}
+
+
+
+@dataclass(slots=True)
+class DailyEntry:
+    """
+    One day's log entry, with fields in DAILY_LOG_SCHEMA order.
+    
+    Only date, sleep_hours and sleep_quality are required; save_entry()
+    and save_entries() accept instances as well as plain dictionaries.
+    """
+    date: str
+    sleep_hours: float
+    sleep_quality: int
+    bedtime: str = ''
+    wake_time: str = ''
+    study_hours: Optional[float] = None
+    exercise_minutes: Optional[int] = None
+    meditation_minutes: Optional[int] = None
+    diet_quality: Optional[int] = None
+    recall_percent: Optional[int] = None
+    pvt_avg_ms: Optional[int] = None
+    mood: Optional[int] = None
+    focus_score: Optional[int] = None
+    energy_level: Optional[int] = None
+    stress_level: Optional[int] = None
+    water_intake_liters: Optional[float] = None
+    screen_time_hours: Optional[float] = None
+    notes: str = ''
+    total_index: Optional[int] = None
+
+
+# Fields every saved entry must provide
+REQUIRED_FIELDS = frozenset(f.name for f in fields(DailyEntry) if f.default is MISSING)
+
+# Numeric columns exposed as NumPy arrays by DataManager.get_column()
+NUMERIC_COLUMNS = [col for col, dtype in DAILY_LOG_SCHEMA.items() if dtype not in ('datetime64[ns]', 'category')]
+
+# Text columns, stored as categoricals
+CATEGORY_COLUMNS = [col for col, dtype in DAILY_LOG_SCHEMA.items() if dtype == 'category']
+
+# Options for every write of the Parquet data file
+PARQUET_WRITE_OPTIONS = dict(engine='pyarrow', compression='zstd', index=False)
+
+# Appended rows are folded into the Parquet file once the pending log grows this long
+PENDING_COMPACT_ROWS = 64
+
+
+# Saves are written by a single background thread; file I/O is serialized by _file_lock
+_write_queue: "queue.Queue" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_file_lock = threading.RLock()
+
+
+def _writer_loop() -> None:
+    """Consume queued saves and write them to disk, one at a time."""
+    while True:
+        manager, rows = _write_queue.get()
+        try:
+            manager._write_rows(rows)
+        except Exception as e:
+            print(f"❌ Error saving entries: {e}")
+        finally:
+            _write_queue.task_done()
+
+
+def _submit_write(manager: "DataManager", rows: pd.DataFrame) -> None:
+    """Queue rows for the background writer, starting it on first use."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="daily-log-writer", daemon=True
+            )
+            _writer_thread.start()
+            # Don't lose queued saves on interpreter shutdown
+            atexit.register(_write_queue.join)
+    _write_queue.put((manager, rows))
+
+
+def _empty_daily_log() -> pd.DataFrame:
+    """Empty DataFrame with the DAILY_LOG_SCHEMA columns and dtypes."""
+    df = pd.DataFrame(columns=DAILY_LOG_SCHEMA.keys())
+    for col, dtype in DAILY_LOG_SCHEMA.items():
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+def _format_hhmm(hours: np.ndarray, minutes: np.ndarray) -> pd.Series:
+    """Format arrays of hours and minutes as 'HH:MM' strings."""
+    return (pd.Series(hours).astype(str).str.zfill(2) + ':'
+            + pd.Series(minutes).astype(str).str.zfill(2))
+
+
+def _file_version(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _matches_schema_dtype(series: pd.Series, dtype: str) -> bool:
+    """Check whether a column already has the kind of dtype the schema asks for."""
+    if dtype == 'datetime64[ns]':
+        return pd.api.types.is_datetime64_any_dtype(series)
+    if dtype == 'category':
+        return isinstance(series.dtype, pd.CategoricalDtype)
+    return series.dtype == dtype
+
+
+@lru_cache(maxsize=8)
+def _read_daily_log(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Read and validate a daily log file (Parquet, or legacy CSV).
+    
+    Cached on (path, mtime, size), so a file is only re-read after it
+    changes on disk. Callers must not mutate the returned DataFrame.
+    
+    Args:
+        path: Path to the .parquet or .csv file
+        mtime_ns: File modification time (cache key only)
+        size: File size in bytes (cache key only)
+    
+    Returns:
+        DataFrame with columns matching DAILY_LOG_SCHEMA, newest first
+    """
+    # Parquet files are only written from validated frames and keep their
+    # dtypes, so matching columns don't need to be coerced again
+    is_parquet = path.endswith('.parquet')
+    if is_parquet:
+        df = pd.read_parquet(path, engine='pyarrow')
+    else:
+        df = pd.read_csv(path, parse_dates=['date'])
+    
+    # Validate columns
+    missing_cols = set(DAILY_LOG_SCHEMA.keys()) - set(df.columns)
+    if missing_cols:
+        print(f"Warning: Missing columns {missing_cols}. Adding them...")
+        for col in missing_cols:
+            df[col] = None
+    
+    # Ensure correct data types, only casting the columns that need it
+    if is_parquet:
+        need_cast = {
+            col: dtype for col, dtype in DAILY_LOG_SCHEMA.items()
+            if not _matches_schema_dtype(df[col], dtype)
+        }
+    else:
+        need_cast = DAILY_LOG_SCHEMA
+    
+    for col, dtype in need_cast.items():
+        try:
+            if dtype == 'datetime64[ns]':
+                df[col] = pd.to_datetime(df[col])
+            elif dtype == 'category':
+                df[col] = df[col].fillna('').astype(str).astype('category')
+            else:
+                # Stays numeric (just not narrowed) if a value doesn't fit
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[col] = df[col].astype(dtype)
+        except Exception as e:
+            print(f"Warning: Could not convert {col} to {dtype}: {e}")
+    
+    # Newest first, so head(n) / iloc[0] are the most recent entries
+    df = df.sort_values('date', ascending=False, kind='stable').reset_index(drop=True)
+    
+    return df
+
+
+@lru_cache(maxsize=8)
+def _read_log_with_pending(
+    path: str,
+    version: Optional[Tuple[int, int]],
+    pending_path: str,
+    pending_version: Optional[Tuple[int, int]]
+) -> pd.DataFrame:
+    """
+    Merge the main log with the rows appended to its pending log.
+    
+    Pending rows are newer than the main file, and later pending rows newer
+    than earlier ones, so the last row wins for duplicate dates. Cached per
+    version of both files; callers must not mutate the returned DataFrame.
+    
+    Args:
+        path: Path to the main .parquet file
+        version: _file_version() of the main file (None if missing)
+        pending_path: Path to the pending .csv file
+        pending_version: _file_version() of the pending file (None if missing)
+    
+    Returns:
+        DataFrame with columns matching DAILY_LOG_SCHEMA, newest first
+    """
+    frames = []
+    if version is not None:
+        frames.append(_read_daily_log(path, *version))
+    if pending_version is not None:
+        frames.append(_read_daily_log(pending_path, *pending_version))
+    
+    if pending_version is None:
+        return frames[0]
+    
+    df = pd.concat(frames, ignore_index=True).drop_duplicates('date', keep='last')
+    df = df.sort_values('date', ascending=False, kind='stable').reset_index(drop=True)
+    
+    # Concatenating categoricals with different categories falls back to strings
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype('category')
+    return df
+
+
+@lru_cache(maxsize=8)
+def _numeric_arrays(
+    path: str,
+    version: Optional[Tuple[int, int]],
+    pending_path: str,
+    pending_version: Optional[Tuple[int, int]]
+) -> Dict[str, np.ndarray]:
+    """
+    Numeric columns of a daily log as contiguous float32 arrays, newest first.
+    
+    Cached per version of both files; the arrays are read-only.
+    """
+    df = _read_log_with_pending(path, version, pending_path, pending_version)
+    arrays = {}
+    for col in NUMERIC_COLUMNS:
+        values = np.ascontiguousarray(df[col].to_numpy(dtype=np.float32, na_value=np.nan))
+        values.setflags(write=False)
+        arrays[col] = values
+    return arrays
+
+
+@lru_cache(maxsize=4)
+def _arrow_table(
+    path: str,
+    version: Optional[Tuple[int, int]],
+    pending_path: str,
+    pending_version: Optional[Tuple[int, int]]
+) -> pa.Table:
+    """
+    Merged daily log as an Arrow table, newest first.
+    
+    Cached per version of both files; Arrow tables are immutable, so the
+    cached table can be shared without copying.
+    """
+    df = _read_log_with_pending(path, version, pending_path, pending_version)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+class _RunningStats:
+    """
+    Summary statistics for a daily log, updated incrementally on save.
+    
+    Built with one scan of the data; appending rows for new dates updates the
+    running sums in place instead of re-scanning the whole log.
+    """
+    
+    AVERAGED_COLUMNS = ('sleep_hours', 'study_hours', 'total_index')
+    
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: Full daily log, newest first
+        """
+        self.dates = set(df['date'])
+        # Newest first, so the date range is at the ends
+        self.min_date = df['date'].iat[-1] if self.dates else None
+        self.max_date = df['date'].iat[0] if self.dates else None
+        
+        # One aggregation pass for all averaged columns
+        totals = df[list(self.AVERAGED_COLUMNS)].agg(['sum', 'count'])
+        self.sums = {col: float(value) for col, value in totals.loc['sum'].items()}
+        self.counts = {col: int(value) for col, value in totals.loc['count'].items()}
+        
+        # One argmax pass; newest first, so ties pick the most recent best day
+        if self.counts['total_index']:
+            scores = df['total_index'].to_numpy(dtype=np.float64, na_value=np.nan)
+            best = int(np.nanargmax(scores))
+            self.best_day = df['date'].iat[best]
+            self.best_score = scores[best]
+        else:
+            self.best_day = None
+            self.best_score = None
+    
+    def add(self, rows: pd.DataFrame) -> bool:
+        """
+        Fold newly appended rows into the statistics.
+        
+        Args:
+            rows: Appended entries (one per date)
+        
+        Returns:
+            True if updated, False if a row replaces an existing date (the
+            statistics must then be rebuilt from the data)
+        """
+        # Entries may leave optional columns out entirely
+        rows = rows.reindex(columns=list(DAILY_LOG_SCHEMA))
+        dates = pd.to_datetime(rows['date'])
+        if dates.isin(self.dates).any():
+            return False
+        
+        for col in self.AVERAGED_COLUMNS:
+            values = pd.to_numeric(rows[col], errors='coerce')
+            self.sums[col] += float(values.sum())
+            self.counts[col] += int(values.count())
+        
+        self.dates.update(dates)
+        self.min_date = min(d for d in (self.min_date, dates.min()) if d is not None)
+        self.max_date = max(d for d in (self.max_date, dates.max()) if d is not None)
+        
+        scores = pd.to_numeric(rows['total_index'], errors='coerce')
+        for entry_date, score in zip(dates, scores):
+            if pd.isna(score):
+                continue
+            if (self.best_score is None or score > self.best_score
+                    or (score == self.best_score and entry_date > self.best_day)):
+                self.best_day = entry_date
+                self.best_score = score
+        
+        return True
+    
+    def mean(self, col: str) -> float:
+        """Mean of a tracked column (0 if it has no values)."""
+        return self.sums[col] / self.counts[col] if self.counts[col] else 0
+    
+    def summary(self) -> Dict:
+        """Statistics in the get_statistics() format."""
+        if not self.dates:
+            return {
+                'total_entries': 0,
+                'date_range': 'No data',
+                'avg_sleep': 0,
+                'avg_study': 0,
+                'avg_total_index': 0
+            }
+        
+        return {
+            'total_entries': len(self.dates),
+            'date_range': f"{self.min_date:{DATE_FORMAT}} to {self.max_date:{DATE_FORMAT}}",
+            'avg_sleep': round(self.mean('sleep_hours'), 1),
+            'avg_study': round(self.mean('study_hours'), 1),
+            'avg_total_index': int(self.mean('total_index')),
+            'best_day': self.best_day.strftime(DATE_FORMAT) if self.best_day is not None else 'N/A',
+            'best_score': int(self.best_score) if self.best_score is not None else 0
+        }
+
+
 class DataManager:
     """
     Manages data persistence for UPSC Neuro-OS application.
     
     Responsibilities:
-    - Load/save daily logs to CSV
+    - Load/save daily logs to Parquet (migrating legacy CSV logs)
+    - Append new entries to a pending CSV log instead of rewriting the Parquet file
+    - Write saves on a background thread so the UI doesn't wait on disk
     - Generate mock data for testing
     - Validate data integrity
     - Handle file I/O errors gracefully
@@ -44,24 +427,73 @@ class DataManager:
         Initialize DataManager with specified data file path.
         
         Args:
-            data_file: Path to CSV file (defaults to DAILY_LOG_FILE from config)
+            data_file: Path to the log file (defaults to DAILY_LOG_FILE from config).
+                A .csv path is treated as a legacy log and migrated to a
+                .parquet file alongside it.
         """
-        self.data_file = data_file or DAILY_LOG_FILE
+        if data_file is None:
+            self.data_file = DAILY_LOG_FILE
+            self.legacy_file = LEGACY_DAILY_LOG_FILE
+        else:
+            data_file = Path(data_file)
+            self.data_file = data_file.with_suffix('.parquet')
+            self.legacy_file = data_file.with_suffix('.csv')
+        self.pending_file = self.data_file.with_suffix('.pending.csv')
+        
+        # Running statistics and the (data, pending) file versions they describe
+        self._stats: Optional[_RunningStats] = None
+        self._stats_version = None
         self.pvt_file = PVT_RESULTS_FILE
         self.analytics_file = ANALYTICS_FILE
         
         # Ensure parent directory exists
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
     
+    def __enter__(self) -> 'DataManager':
+        """
+        Use the manager as a context; saves are folded into Parquet on exit.
+        
+        Examples:
+            >>> with DataManager() as dm:
+            ...     dm.save_entries(dm.get_mock_data(30))
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Write queued saves and compact the pending log."""
+        self.compact()
+    
+    def _migrate_legacy_csv(self) -> None:
+        """
+        One-time migration of a legacy CSV log to Parquet.
+        
+        Runs only when the Parquet file doesn't exist yet. The CSV is kept
+        as a backup with a .migrated suffix so it isn't imported again.
+        """
+        if self.data_file.exists() or not self.legacy_file.exists():
+            return
+        
+        try:
+            stat = self.legacy_file.stat()
+            df = _read_daily_log(str(self.legacy_file), stat.st_mtime_ns, stat.st_size)
+            df.to_parquet(self.data_file, **PARQUET_WRITE_OPTIONS)
+            self.legacy_file.rename(self.legacy_file.with_suffix('.csv.migrated'))
+            print(f"Migrated {self.legacy_file} to {self.data_file}")
+        except Exception as e:
+            print(f"Error migrating {self.legacy_file}: {e}")
+    
     def load_data(self) -> pd.DataFrame:
         """
-        Load daily log data from CSV file.
+        Load daily log data from the Parquet file and its pending log.
         
-        If file doesn't exist, returns an empty DataFrame with correct schema.
+        If neither file exists, returns an empty DataFrame with correct schema.
         Handles corrupted files by backing up and starting fresh.
+        Waits for queued saves first, so it always sees them.
+        The merged data is cached until either file changes on disk.
         
         Returns:
-            DataFrame with columns matching REQUIRED_COLUMNS
+            DataFrame with columns matching REQUIRED_COLUMNS, sorted by date
+            (most recent first)
         
         Examples:
             >>> dm = DataManager()
@@ -69,140 +501,199 @@ class DataManager:
             >>> print(df.columns.tolist())
             ['date', 'sleep_hours', 'sleep_quality', ...]
         """
-        # Define the schema for daily logs
-        schema = {
-            'date': 'object',
-            'sleep_hours': 'float64',
-            'sleep_quality': 'int64',
-            'bedtime': 'object',
-            'wake_time': 'object',
-            'study_hours': 'float64',
-            'exercise_minutes': 'int64',
-            'meditation_minutes': 'int64',
-            'diet_quality': 'int64',
-            'recall_percent': 'int64',
-            'pvt_avg_ms': 'int64',
-            'mood': 'int64',
-            'focus_score': 'int64',
-            'energy_level': 'int64',
-            'stress_level': 'int64',
-            'water_intake_liters': 'float64',
-            'screen_time_hours': 'float64',
-            'notes': 'object',
-            'total_index': 'int64'
-        }
+        self.flush()
         
-        if not self.data_file.exists():
-            # Create empty DataFrame with correct schema
-            df = pd.DataFrame(columns=schema.keys())
-            for col, dtype in schema.items():
-                df[col] = df[col].astype(dtype)
-            return df
-        
-        try:
-            df = pd.read_csv(self.data_file, parse_dates=['date'])
+        with _file_lock:
+            self._migrate_legacy_csv()
             
-            # Validate columns
-            missing_cols = set(schema.keys()) - set(df.columns)
-            if missing_cols:
-                print(f"Warning: Missing columns {missing_cols}. Adding them...")
-                for col in missing_cols:
-                    df[col] = None
+            version = _file_version(self.data_file)
+            pending_version = _file_version(self.pending_file)
             
-            # Ensure correct data types
-            for col, dtype in schema.items():
-                if col in df.columns:
-                    try:
-                        if dtype == 'object':
-                            df[col] = df[col].astype(str).replace('nan', '')
-                        else:
-                            df[col] = pd.to_numeric(df[col], errors='coerce')
-                    except Exception as e:
-                        print(f"Warning: Could not convert {col} to {dtype}: {e}")
+            if version is None and pending_version is None:
+                return _empty_daily_log()
             
-            return df
-        
-        except Exception as e:
-            print(f"Error loading data from {self.data_file}: {e}")
-            # Backup corrupted file
-            backup_path = self.data_file.with_suffix('.csv.backup')
-            if self.data_file.exists():
-                self.data_file.rename(backup_path)
-                print(f"Corrupted file backed up to {backup_path}")
+            try:
+                # Parsed frames are cached per file version; hand out a copy so
+                # callers can't mutate the cached one
+                return _read_log_with_pending(
+                    str(self.data_file), version, str(self.pending_file), pending_version
+                ).copy()
             
-            # Return empty DataFrame
-            df = pd.DataFrame(columns=schema.keys())
-            for col, dtype in schema.items():
-                df[col] = df[col].astype(dtype)
-            return df
+            except Exception as e:
+                print(f"Error loading data from {self.data_file}: {e}")
+                # Backup corrupted files
+                for path in (self.data_file, self.pending_file):
+                    if path.exists():
+                        backup_path = path.with_suffix(path.suffix + '.backup')
+                        path.rename(backup_path)
+                        print(f"Corrupted file backed up to {backup_path}")
+                
+                return _empty_daily_log()
     
     def save_entry(self, entry: Dict) -> bool:
         """
-        Save a new daily log entry to CSV file.
+        Save a new daily log entry.
         
-        Appends the entry to existing data or creates new file if needed.
+        Queues the entry for the background writer, which appends it to the
+        pending log, replacing any stored entry for the same date.
         Validates entry data before saving.
         
         Args:
-            entry: Dictionary containing daily log fields
+            entry: DailyEntry or dictionary containing daily log fields
         
         Returns:
-            True if save successful, False otherwise
+            True if the entry was queued, False otherwise
         
         Raises:
             ValueError: If required fields are missing
         
         Examples:
             >>> dm = DataManager()
-            >>> entry = {
-            ...     'date': '2025-11-29',
-            ...     'sleep_hours': 7.5,
-            ...     'sleep_quality': 8,
-            ...     'total_index': 85
-            ... }
+            >>> entry = DailyEntry(
+            ...     date='2025-11-29',
+            ...     sleep_hours=7.5,
+            ...     sleep_quality=8,
+            ...     total_index=85
+            ... )
             >>> dm.save_entry(entry)
             True
         """
+        return self.save_entries([entry])
+    
+    def save_entries(self, entries) -> bool:
+        """
+        Save several daily log entries with a single append.
+        
+        Entries replace any stored rows with the same date. Rows are appended
+        to the pending log, so a save costs the same regardless of history
+        size; the pending log is folded into the Parquet file by compact().
+        The write happens on a background thread: this returns once the
+        rows are queued, and write errors are only printed. Call flush() to
+        wait for the write.
+        
+        Args:
+            entries: DataFrame or list of DailyEntry objects/dictionaries with daily log fields
+        
+        Returns:
+            True if the entries were queued, False otherwise
+        
+        Raises:
+            ValueError: If required fields are missing
+        
+        Examples:
+            >>> dm = DataManager()
+            >>> dm.save_entries(dm.get_mock_data(7))
+            True
+        """
         # Validate required fields
-        required_fields = ['date', 'sleep_hours', 'sleep_quality']
-        missing_fields = [f for f in required_fields if f not in entry]
+        if isinstance(entries, pd.DataFrame):
+            new_entries = entries.copy()
+            missing_fields = REQUIRED_FIELDS - set(new_entries.columns)
+        else:
+            entries = [asdict(e) if isinstance(e, DailyEntry) else e for e in entries]
+            missing_fields = set().union(*(REQUIRED_FIELDS - e.keys() for e in entries))
+            new_entries = pd.DataFrame(entries)
         if missing_fields:
-            raise ValueError(f"Missing required fields: {missing_fields}")
+            raise ValueError(f"Missing required fields: {sorted(missing_fields)}")
+        
+        if new_entries.empty:
+            return True
         
         try:
-            # Load existing data
-            df = self.load_data()
+            # Normalize dates to midnight timestamps; the last entry per date wins
+            new_entries['date'] = pd.to_datetime(new_entries['date']).dt.normalize()
+            new_entries = new_entries.drop_duplicates('date', keep='last')
             
-            # Create new entry DataFrame
-            new_entry = pd.DataFrame([entry])
-            
-            # Ensure date is properly formatted
-            if 'date' in new_entry.columns:
-                new_entry['date'] = pd.to_datetime(new_entry['date']).dt.strftime(DATE_FORMAT)
-            
-            # Check for duplicate date
-            if not df.empty and 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date']).dt.strftime(DATE_FORMAT)
-                
-                if entry['date'] in df['date'].values:
-                    # Update existing entry
-                    df = df[df['date'] != entry['date']]
-                    print(f"Updating existing entry for {entry['date']}")
-            
-            # Append new entry
-            df = pd.concat([df, new_entry], ignore_index=True)
+            _submit_write(self, new_entries)
+            return True
+        
+        except Exception as e:
+            print(f"❌ Error saving entries: {e}")
+            return False
+    
+    def flush(self) -> None:
+        """Block until all queued saves have been written to disk."""
+        _write_queue.join()
+    
+    def _write_rows(self, rows: pd.DataFrame) -> None:
+        """
+        Append rows to the pending log, compacting it once it grows too long.
+        
+        Runs on the background writer thread.
+        
+        Args:
+            rows: Entries to append (dates already normalized)
+        """
+        with _file_lock:
+            stats_current = self._stats is not None and self._stats_version == self._versions()
             
-            # Sort by date (most recent first)
-            df = df.sort_values('date', ascending=False)
+            self._append_rows(rows)
+            print(f"✅ {len(rows)} entries saved successfully to {self.pending_file}")
             
-            # Save to CSV
-            df.to_csv(self.data_file, index=False)
-            print(f"✅ Entry saved successfully to {self.data_file}")
+            if self._pending_row_count() >= PENDING_COMPACT_ROWS:
+                self._compact()
             
+            # Keep running statistics in step, or drop them to be rebuilt
+            if stats_current and self._stats.add(rows):
+                self._stats_version = self._versions()
+            else:
+                self._stats = None
+    
+    def _versions(self) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """Current _file_version() of the data file and the pending log."""
+        return (_file_version(self.data_file), _file_version(self.pending_file))
+    
+    def _append_rows(self, rows: pd.DataFrame) -> None:
+        """
+        Append rows to the pending CSV log.
+        
+        Rows are written in DAILY_LOG_SCHEMA column order; the header is only
+        written when the pending log is created.
+        
+        Args:
+            rows: Entries to append (dates already normalized)
+        """
+        write_header = not self.pending_file.exists() or self.pending_file.stat().st_size == 0
+        rows.reindex(columns=list(DAILY_LOG_SCHEMA)).to_csv(
+            self.pending_file, mode='a', header=write_header, index=False,
+            date_format=DATE_FORMAT
+        )
+    
+    def _pending_row_count(self) -> int:
+        """Number of rows in the pending log (bounded by PENDING_COMPACT_ROWS)."""
+        if not self.pending_file.exists():
+            return 0
+        with open(self.pending_file, 'rb') as f:
+            return max(sum(1 for _ in f) - 1, 0)
+    
+    def compact(self) -> bool:
+        """
+        Fold the pending log into the Parquet file with a single rewrite.
+        
+        Returns:
+            True if successful (or nothing to compact), False otherwise
+        """
+        self.flush()
+        with _file_lock:
+            return self._compact()
+    
+    def _compact(self) -> bool:
+        """compact() without waiting for queued saves; caller holds _file_lock."""
+        if not self.pending_file.exists():
+            return True
+        
+        try:
+            version = _file_version(self.data_file)
+            pending_version = _file_version(self.pending_file)
+            df = _read_log_with_pending(
+                str(self.data_file), version, str(self.pending_file), pending_version
+            )
+            df.to_parquet(self.data_file, **PARQUET_WRITE_OPTIONS)
+            self.pending_file.unlink()
             return True
         
         except Exception as e:
-            print(f"❌ Error saving entry: {e}")
+            print(f"❌ Error compacting {self.pending_file}: {e}")
             return False
     
     def get_mock_data(self, num_days: int = 7) -> pd.DataFrame:
@@ -226,137 +717,131 @@ class DataManager:
             >>> print(mock_df['sleep_hours'].mean())
             ~7.2
         """
-        np.random.seed(42)  # For reproducibility
+        rng = np.random.default_rng(42)  # For reproducibility
+        n = num_days
         
-        mock_entries = []
         base_date = datetime.now() - timedelta(days=num_days - 1)
+        dates = pd.date_range(base_date.date(), periods=n, freq='D')
         
-        for i in range(num_days):
-            current_date = base_date + timedelta(days=i)
-            
-            # Realistic sleep patterns (6-9 hours, trending towards 7-8)
-            sleep_hours = np.clip(np.random.normal(7.2, 0.8), 5.5, 9.5)
-            sleep_quality = int(np.clip(np.random.normal(7, 1.5), 3, 10))
-            
-            # Bedtime variations (21:30 - 23:30)
-            bedtime_hour = np.random.randint(21, 24)
-            bedtime_minute = np.random.choice([0, 15, 30, 45])
-            bedtime = f"{bedtime_hour:02d}:{bedtime_minute:02d}"
-            
-            # Wake time based on sleep hours
-            wake_hour = int((bedtime_hour + sleep_hours) % 24)
-            if wake_hour < 5:
-                wake_hour += 5
-            wake_minute = np.random.choice([0, 15, 30, 45])
-            wake_time = f"{wake_hour:02d}:{wake_minute:02d}"
-            
-            # Study hours (4-12 hours, with some variation)
-            study_hours = np.clip(np.random.normal(8, 2), 3, 14)
-            
-            # Exercise (0-90 minutes, bimodal: either 0-15 or 30-60)
-            exercise_minutes = int(
-                np.random.choice([
-                    np.random.randint(0, 20),
-                    np.random.randint(30, 75)
-                ])
-            )
-            
-            # Meditation (0-45 minutes)
-            meditation_minutes = int(np.random.choice([0, 10, 15, 20, 30]))
-            
-            # Diet quality (5-10, trending higher)
-            diet_quality = int(np.clip(np.random.normal(7.5, 1.2), 4, 10))
-            
-            # Recall percentage (60-95%)
-            recall_percent = int(np.clip(np.random.normal(78, 8), 55, 98))
-            
-            # PVT reaction time (200-450ms, lower is better)
-            pvt_avg_ms = int(np.clip(np.random.normal(280, 50), 180, 500))
-            
-            # Mood, focus, energy (correlated with sleep quality)
-            mood = int(np.clip(sleep_quality + np.random.randint(-2, 3), 3, 10))
-            focus_score = int(np.clip(sleep_quality + np.random.randint(-1, 2), 4, 10))
-            energy_level = int(np.clip(sleep_quality + np.random.randint(-2, 2), 3, 10))
-            
-            # Stress (inversely correlated with sleep)
-            stress_level = int(np.clip(10 - sleep_quality + np.random.randint(-2, 3), 2, 10))
-            
-            # Water intake (1.5-4 liters)
-            water_intake_liters = round(np.clip(np.random.normal(2.5, 0.6), 1.0, 4.5), 1)
-            
-            # Screen time (2-8 hours)
-            screen_time_hours = round(np.clip(np.random.normal(4.5, 1.5), 2, 9), 1)
-            
-            # Random notes
-            notes_options = [
-                "Productive day, good focus",
-                "Felt tired in afternoon",
-                "Excellent study session",
-                "Struggled with concentration",
-                "Great workout today",
-                "Need more sleep",
-                "Very focused, minimal distractions",
-                ""
-            ]
-            notes = np.random.choice(notes_options)
-            
-            # Calculate total index (simplified for mock data)
-            total_index = int(
-                (sleep_quality * 2) +
-                (diet_quality * 2) +
-                (recall_percent * 0.3) +
-                (min(10, exercise_minutes / 4.5)) +
-                (20 - (pvt_avg_ms - 200) / 15) -
-                (abs(23 - int(bedtime.split(':')[0])))
-            )
-            total_index = max(50, min(95, total_index))  # Clamp to realistic range
-            
-            entry = {
-                'date': current_date.strftime(DATE_FORMAT),
-                'sleep_hours': round(sleep_hours, 1),
-                'sleep_quality': sleep_quality,
-                'bedtime': bedtime,
-                'wake_time': wake_time,
-                'study_hours': round(study_hours, 1),
-                'exercise_minutes': exercise_minutes,
-                'meditation_minutes': meditation_minutes,
-                'diet_quality': diet_quality,
-                'recall_percent': recall_percent,
-                'pvt_avg_ms': pvt_avg_ms,
-                'mood': mood,
-                'focus_score': focus_score,
-                'energy_level': energy_level,
-                'stress_level': stress_level,
-                'water_intake_liters': water_intake_liters,
-                'screen_time_hours': screen_time_hours,
-                'notes': notes,
-                'total_index': total_index
-            }
-            
-            mock_entries.append(entry)
+        # Realistic sleep patterns (6-9 hours, trending towards 7-8)
+        sleep_hours = np.clip(rng.normal(7.2, 0.8, n), 5.5, 9.5)
+        sleep_quality = np.clip(rng.normal(7, 1.5, n), 3, 10).astype(int)
+        
+        # Bedtime variations (21:30 - 23:30)
+        bedtime_hour = rng.integers(21, 24, n)
+        bedtime_minute = rng.choice([0, 15, 30, 45], n)
+        
+        # Wake time based on sleep hours
+        wake_hour = ((bedtime_hour + sleep_hours) % 24).astype(int)
+        wake_hour = np.where(wake_hour < 5, wake_hour + 5, wake_hour)
+        wake_minute = rng.choice([0, 15, 30, 45], n)
+        
+        # Study hours (4-12 hours, with some variation)
+        study_hours = np.clip(rng.normal(8, 2, n), 3, 14)
+        
+        # Exercise (0-90 minutes, bimodal: either 0-15 or 30-60)
+        exercise_minutes = np.where(
+            rng.random(n) < 0.5,
+            rng.integers(0, 20, n),
+            rng.integers(30, 75, n)
+        )
+        
+        # Meditation (0-45 minutes)
+        meditation_minutes = rng.choice([0, 10, 15, 20, 30], n)
+        
+        # Diet quality (5-10, trending higher)
+        diet_quality = np.clip(rng.normal(7.5, 1.2, n), 4, 10).astype(int)
+        
+        # Recall percentage (60-95%)
+        recall_percent = np.clip(rng.normal(78, 8, n), 55, 98).astype(int)
+        
+        # PVT reaction time (200-450ms, lower is better)
+        pvt_avg_ms = np.clip(rng.normal(280, 50, n), 180, 500).astype(int)
+        
+        # Mood, focus, energy (correlated with sleep quality)
+        mood = np.clip(sleep_quality + rng.integers(-2, 3, n), 3, 10)
+        focus_score = np.clip(sleep_quality + rng.integers(-1, 2, n), 4, 10)
+        energy_level = np.clip(sleep_quality + rng.integers(-2, 2, n), 3, 10)
+        
+        # Stress (inversely correlated with sleep)
+        stress_level = np.clip(10 - sleep_quality + rng.integers(-2, 3, n), 2, 10)
         
-        df = pd.DataFrame(mock_entries)
+        # Water intake (1.5-4 liters)
+        water_intake_liters = np.clip(rng.normal(2.5, 0.6, n), 1.0, 4.5).round(1)
+        
+        # Screen time (2-8 hours)
+        screen_time_hours = np.clip(rng.normal(4.5, 1.5, n), 2, 9).round(1)
+        
+        # Random notes
+        notes_options = [
+            "Productive day, good focus",
+            "Felt tired in afternoon",
+            "Excellent study session",
+            "Struggled with concentration",
+            "Great workout today",
+            "Need more sleep",
+            "Very focused, minimal distractions",
+            ""
+        ]
+        # Drawn as category codes, so no per-row string array is built
+        notes = pd.Categorical.from_codes(rng.integers(0, len(notes_options), n), categories=notes_options)
+        
+        # Calculate total index (simplified for mock data)
+        total_index = (
+            (sleep_quality * 2) +
+            (diet_quality * 2) +
+            (recall_percent * 0.3) +
+            np.minimum(10, exercise_minutes / 4.5) +
+            (20 - (pvt_avg_ms - 200) / 15) -
+            np.abs(23 - bedtime_hour)
+        ).astype(int)
+        total_index = np.clip(total_index, 50, 95)  # Clamp to realistic range
+        
+        df = pd.DataFrame({
+            'date': dates.strftime(DATE_FORMAT),
+            'sleep_hours': sleep_hours.round(1),
+            'sleep_quality': sleep_quality,
+            'bedtime': _format_hhmm(bedtime_hour, bedtime_minute),
+            'wake_time': _format_hhmm(wake_hour, wake_minute),
+            'study_hours': study_hours.round(1),
+            'exercise_minutes': exercise_minutes,
+            'meditation_minutes': meditation_minutes,
+            'diet_quality': diet_quality,
+            'recall_percent': recall_percent,
+            'pvt_avg_ms': pvt_avg_ms,
+            'mood': mood,
+            'focus_score': focus_score,
+            'energy_level': energy_level,
+            'stress_level': stress_level,
+            'water_intake_liters': water_intake_liters,
+            'screen_time_hours': screen_time_hours,
+            'notes': notes,
+            'total_index': total_index
+        })
         return df
     
     def clear_data(self) -> bool:
         """
-        Clear all data from the CSV file (use with caution).
+        Clear all data from the log file (use with caution).
         
         Returns:
             True if successful, False otherwise
         """
         try:
-            if self.data_file.exists():
-                # Backup before clearing
-                backup_path = self.data_file.with_suffix(
-                    f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-                )
-                self.data_file.rename(backup_path)
-                print(f"Data backed up to {backup_path}")
+            self.flush()
             
-            # Create empty file
-            empty_df = self.load_data()
-            empty_df.to_csv(self.data_file, index=False)
+            with _file_lock:
+                # Backup before clearing; the pending log is moved aside with
+                # the data file rather than compacted into it first
+                stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                for path, suffix in ((self.data_file, '.parquet'), (self.pending_file, '.pending.csv')):
+                    if path.exists():
+                        backup_path = self.data_file.with_suffix(f'.backup_{stamp}{suffix}')
+                        path.rename(backup_path)
+                        print(f"Data backed up to {backup_path}")
+                
+                # Create empty file
+                _empty_daily_log().to_parquet(self.data_file, **PARQUET_WRITE_OPTIONS)
             print("✅ Data cleared successfully")
             return True
         
@@ -364,35 +849,107 @@ class DataManager:
             print(f"❌ Error clearing data: {e}")
             return False
     
+    def get_column(self, name: str) -> np.ndarray:
+        """
+        Get a numeric column as a read-only float32 NumPy array.
+        
+        Reductions over the array (mean, max, ...) skip pandas overhead.
+        Arrays are cached until the data files change on disk.
+        
+        Args:
+            name: Column name from NUMERIC_COLUMNS
+        
+        Returns:
+            Array of the column's values, newest first (NaN where missing)
+        
+        Raises:
+            ValueError: If name is not a numeric column
+        
+        Examples:
+            >>> dm = DataManager()
+            >>> dm.get_column('sleep_hours').mean()
+            7.2
+        """
+        if name not in NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown numeric column: {name}")
+        
+        self.flush()
+        with _file_lock:
+            version, pending_version = self._versions()
+            if version is not None or pending_version is not None:
+                try:
+                    return _numeric_arrays(
+                        str(self.data_file), version, str(self.pending_file), pending_version
+                    )[name]
+                except Exception:
+                    pass  # Let load_data() handle (and back up) an unreadable file
+        
+        return self.load_data()[name].to_numpy(dtype=np.float32, na_value=np.nan)
+    
+    def load_arrow(self) -> pa.Table:
+        """
+        Load daily log data as an immutable pyarrow Table.
+        
+        Same rows and order as load_data(), but the cached table is shared
+        instead of copied, and can be viewed from Arrow-aware libraries
+        (e.g. polars.from_arrow) without converting through pandas.
+        
+        Returns:
+            Table with columns matching DAILY_LOG_SCHEMA, newest first
+        
+        Examples:
+            >>> dm = DataManager()
+            >>> table = dm.load_arrow()
+            >>> table.num_rows
+            7
+        """
+        self.flush()
+        with _file_lock:
+            version, pending_version = self._versions()
+            if version is not None or pending_version is not None:
+                try:
+                    return _arrow_table(
+                        str(self.data_file), version, str(self.pending_file), pending_version
+                    )
+                except Exception:
+                    pass  # Let load_data() handle (and back up) an unreadable file
+        
+        return pa.Table.from_pandas(self.load_data(), preserve_index=False)
+    
     def get_statistics(self) -> Dict:
         """
         Get summary statistics from stored data.
         
+        Statistics are computed with one scan of the data and then kept up
+        to date by this manager's saves; they are only rebuilt when a save
+        replaces an existing date or the files are changed by someone else.
+        
         Returns:
             Dictionary with key metrics (averages, trends, etc.)
         """
-        df = self.load_data()
-        
-        if df.empty:
-            return {
-                'total_entries': 0,
-                'date_range': 'No data',
-                'avg_sleep': 0,
-                'avg_study': 0,
-                'avg_total_index': 0
-            }
-        
-        stats = {
-            'total_entries': len(df),
-            'date_range': f"{df['date'].min()} to {df['date'].max()}",
-            'avg_sleep': round(df['sleep_hours'].mean(), 1) if 'sleep_hours' in df else 0,
-            'avg_study': round(df['study_hours'].mean(), 1) if 'study_hours' in df else 0,
-            'avg_total_index': int(df['total_index'].mean()) if 'total_index' in df else 0,
-            'best_day': df.loc[df['total_index'].idxmax(), 'date'] if 'total_index' in df and not df.empty else 'N/A',
-            'best_score': int(df['total_index'].max()) if 'total_index' in df else 0
-        }
+        self.flush()
+        with _file_lock:
+            versions = self._versions()
+            if self._stats is not None and self._stats_version == versions:
+                return self._stats.summary()
+            
+            version, pending_version = versions
+            try:
+                if version is None and pending_version is None:
+                    df = _empty_daily_log()
+                else:
+                    df = _read_log_with_pending(
+                        str(self.data_file), version, str(self.pending_file), pending_version
+                    )
+            except Exception:
+                df = None  # Let load_data() handle (and back up) an unreadable file
+            
+            if df is not None:
+                self._stats = _RunningStats(df)
+                self._stats_version = versions
+                return self._stats.summary()
         
-        return stats
+        return _RunningStats(self.load_data()).summary()
 
 
 # Convenience functions
@@ -406,6 +963,11 @@ def quick_save(entry: Dict) -> bool:
     return DataManager().save_entry(entry)
 
 
+def quick_save_many(entries) -> bool:
+    """Quick wrapper to save several entries at once."""
+    return DataManager().save_entries(entries)
+
+
 def quick_mock(days: int = 7) -> pd.DataFrame:
     """Quick wrapper to generate mock data."""
     return DataManager().get_mock_data(days)
@@ -8,9 +8,34 @@ Author: Senior Python Software Architect
 Date: November 29, 2025
 """
 
-from datetime import datetime, time
-from typing import Dict, Optional, Tuple
-import math
+from bisect import bisect_right
+from datetime import time
+from typing import Dict, Optional, Tuple, Union
+import numpy as np
+
+
+def _minutes_of_day(t: time) -> int:
+    """Convert a time of day to whole minutes since midnight."""
+    return t.hour * 60 + t.minute
+
+
+def _parse_minutes(value: Union[str, time]) -> int:
+    """Convert a time object or "HH:MM" string to minutes since midnight."""
+    if isinstance(value, time):
+        return _minutes_of_day(value)
+    # Parsed by hand: strptime is slow and this is called twice per score
+    hours, sep, minutes = value.partition(':')
+    if (sep and 0 < len(hours) <= 2 and 0 < len(minutes) <= 2 and value.isascii()
+            and hours.isdigit() and minutes.isdigit()):
+        hour, minute = int(hours), int(minutes)
+        if hour < 24 and minute < 60:
+            return hour * 60 + minute
+    raise ValueError("Time must be in HH:MM format (24-hour)")
+
+
+def _ceil_hours(minutes: int) -> int:
+    """Round a positive minute count up to whole hours."""
+    return -(-minutes // 60)
 
 
 class NeuroScorer:
@@ -21,6 +46,8 @@ class NeuroScorer:
     for sleep quality, circadian rhythm, reaction time (PVT), and overall cognitive index.
     """
     
+    __slots__ = ('debug_mode',)
+    
     # Scoring Constants
     OPTIMAL_SLEEP_HOURS = 7.5
     MAX_SLEEP_SCORE = 20
@@ -34,6 +61,33 @@ class NeuroScorer:
     OPTIMAL_WAKE_START = time(5, 30)     # 5:30 AM
     OPTIMAL_WAKE_END = time(7, 0)        # 7:00 AM
     
+    # Same windows as minutes since midnight, for the integer penalty core
+    _BED_START_MIN = _minutes_of_day(OPTIMAL_BEDTIME_START)
+    _BED_END_MIN = _minutes_of_day(OPTIMAL_BEDTIME_END)
+    _WAKE_START_MIN = _minutes_of_day(OPTIMAL_WAKE_START)
+    _WAKE_END_MIN = _minutes_of_day(OPTIMAL_WAKE_END)
+    
+    # Performance categories by total index: lower bounds and (category, description)
+    CATEGORY_THRESHOLDS = (50, 60, 70, 80, 90)
+    CATEGORIES = (
+        ("Poor", "Critical intervention required"),
+        ("Below Average", "Significant improvement needed"),
+        ("Fair", "Moderate performance - focus on key areas"),
+        ("Good", "Solid performance with room for improvement"),
+        ("Excellent", "High cognitive efficiency"),
+        ("Elite", "Exceptional cognitive performance")
+    )
+    
+    # Valid (min, max) range of each total-index input metric
+    TOTAL_INDEX_RANGES = {
+        'sleep_score': (0, 20),
+        'pvt_score': (0, 20),
+        'diet_quality': (0, 10),
+        'recall_percent': (0, 100),
+        'exercise_minutes': (0, 120),
+        'circadian_penalty': (0, 10)
+    }
+    
     def __init__(self):
         """Initialize the NeuroScorer with default configuration."""
         self.debug_mode = False
@@ -71,8 +125,8 @@ class NeuroScorer:
     
     def calculate_circadian_penalty(
         self, 
-        bedtime: str, 
-        wake_time: str
+        bedtime: Union[str, time], 
+        wake_time: Union[str, time]
     ) -> int:
         """
         Calculate penalty based on circadian rhythm alignment.
@@ -81,8 +135,8 @@ class NeuroScorer:
         Optimal: Sleep 10:00-11:30 PM, Wake 5:30-7:00 AM
         
         Args:
-            bedtime: Bedtime in "HH:MM" format (24-hour)
-            wake_time: Wake time in "HH:MM" format (24-hour)
+            bedtime: Bedtime as a time object or "HH:MM" string (24-hour)
+            wake_time: Wake time as a time object or "HH:MM" string (24-hour)
         
         Returns:
             Penalty points (0-10, where 0 = perfect alignment)
@@ -93,48 +147,47 @@ class NeuroScorer:
             0
             >>> scorer.calculate_circadian_penalty("02:00", "10:00")
             8
+            >>> scorer.calculate_circadian_penalty(time(23, 45), time(6, 0))
+            1
         """
-        try:
-            bed_dt = datetime.strptime(bedtime, "%H:%M").time()
-            wake_dt = datetime.strptime(wake_time, "%H:%M").time()
-        except ValueError:
-            raise ValueError("Time must be in HH:MM format (24-hour)")
+        return self._circadian_penalty_minutes(
+            _parse_minutes(bedtime),
+            _parse_minutes(wake_time)
+        )
+    
+    def _circadian_penalty_minutes(self, bed_minutes: int, wake_minutes: int) -> int:
+        """
+        Integer core of calculate_circadian_penalty.
+        
+        Args:
+            bed_minutes: Bedtime as minutes since midnight
+            wake_minutes: Wake time as minutes since midnight
+        
+        Returns:
+            Penalty points (0-10)
+        """
+        bed_start = self._BED_START_MIN
+        bed_end = self._BED_END_MIN
+        wake_start = self._WAKE_START_MIN
+        wake_end = self._WAKE_END_MIN
         
         penalty = 0
         
-        # Bedtime penalty (1 point per hour deviation)
-        if not (self.OPTIMAL_BEDTIME_START <= bed_dt <= self.OPTIMAL_BEDTIME_END):
-            if bed_dt < self.OPTIMAL_BEDTIME_START:
-                # Too early (before 10 PM)
-                hours_diff = (
-                    datetime.combine(datetime.today(), self.OPTIMAL_BEDTIME_START) -
-                    datetime.combine(datetime.today(), bed_dt)
-                ).total_seconds() / 3600
-            else:
-                # Too late (after 11:30 PM)
-                hours_diff = (
-                    datetime.combine(datetime.today(), bed_dt) -
-                    datetime.combine(datetime.today(), self.OPTIMAL_BEDTIME_END)
-                ).total_seconds() / 3600
-            
-            penalty += min(5, math.ceil(hours_diff))  # Max 5 points for bedtime
-        
-        # Wake time penalty (1 point per hour deviation)
-        if not (self.OPTIMAL_WAKE_START <= wake_dt <= self.OPTIMAL_WAKE_END):
-            if wake_dt < self.OPTIMAL_WAKE_START:
-                # Too early (before 5:30 AM)
-                hours_diff = (
-                    datetime.combine(datetime.today(), self.OPTIMAL_WAKE_START) -
-                    datetime.combine(datetime.today(), wake_dt)
-                ).total_seconds() / 3600
-            else:
-                # Too late (after 7:00 AM)
-                hours_diff = (
-                    datetime.combine(datetime.today(), wake_dt) -
-                    datetime.combine(datetime.today(), self.OPTIMAL_WAKE_END)
-                ).total_seconds() / 3600
-            
-            penalty += min(5, math.ceil(hours_diff))  # Max 5 points for wake time
+        # Bedtime penalty (1 point per started hour of deviation)
+        if bed_minutes < bed_start:
+            # Too early (before 10 PM)
+            penalty += min(5, _ceil_hours(bed_start - bed_minutes))
+        elif bed_minutes > bed_end:
+            # Too late (after 11:30 PM)
+            penalty += min(5, _ceil_hours(bed_minutes - bed_end))
+        
+        # Wake time penalty (1 point per started hour of deviation)
+        if wake_minutes < wake_start:
+            # Too early (before 5:30 AM)
+            penalty += min(5, _ceil_hours(wake_start - wake_minutes))
+        elif wake_minutes > wake_end:
+            # Too late (after 7:00 AM)
+            penalty += min(5, _ceil_hours(wake_minutes - wake_end))
         
         return min(10, penalty)  # Cap at 10 total penalty points
     
@@ -283,6 +336,135 @@ class NeuroScorer:
         
         return int(round(total))
     
+    def calculate_sleep_score_vectorized(self, hours) -> np.ndarray:
+        """
+        Calculate sleep scores for many entries at once.
+        
+        Same formula and validation as calculate_sleep_score.
+        
+        Args:
+            hours: Array-like of sleep durations in hours (0.0 - 16.0)
+        
+        Returns:
+            Float array of sleep scores (0.0 - 20.0)
+        
+        Raises:
+            ValueError: If any duration is negative or unrealistic (> 16)
+        
+        Examples:
+            >>> scorer = NeuroScorer()
+            >>> scorer.calculate_sleep_score_vectorized([7.5, 6.0])
+            array([20., 16.])
+        """
+        hours = np.asarray(hours, dtype=float)
+        if np.any(hours < 0):
+            raise ValueError("Sleep hours cannot be negative")
+        if np.any(hours > 16):
+            raise ValueError("Sleep hours cannot exceed 16 (unrealistic)")
+        
+        # Linear scaling with cap at optimal sleep
+        return np.minimum(self.MAX_SLEEP_SCORE, (hours / self.OPTIMAL_SLEEP_HOURS) * self.MAX_SLEEP_SCORE)
+    
+    def calculate_pvt_score_vectorized(self, ms) -> np.ndarray:
+        """
+        Calculate PVT scores for many reaction times at once.
+        
+        Same formula, validation and rounding as calculate_pvt_score.
+        
+        Args:
+            ms: Array-like of reaction times in milliseconds (100-3000)
+        
+        Returns:
+            Float array of PVT scores (0.0 - 20.0, higher is better)
+        
+        Raises:
+            ValueError: If any reaction time is unrealistic
+        
+        Examples:
+            >>> scorer = NeuroScorer()
+            >>> scorer.calculate_pvt_score_vectorized([200, 500, 1000])
+            array([20., 15.,  5.])
+        """
+        ms = np.asarray(ms, dtype=float)
+        if np.any(ms < 100):
+            raise ValueError("Reaction time < 100ms is unrealistic (anticipation)")
+        if np.any(ms > 3000):
+            raise ValueError("Reaction time > 3000ms is unrealistic (lapse)")
+        
+        # Linear decay from optimal to penalty threshold, then 1 point per 50ms
+        decay = self.MAX_PVT_SCORE - (
+            (ms - self.OPTIMAL_PVT_MS) /
+            (self.PENALTY_PVT_MS - self.OPTIMAL_PVT_MS) * 5
+        )
+        penalty = np.maximum(0.0, self.MAX_PVT_SCORE - 5 - (ms - self.PENALTY_PVT_MS) / 50)
+        
+        scores = np.where(ms <= self.PENALTY_PVT_MS, decay, penalty).round(2)
+        return np.where(ms <= self.OPTIMAL_PVT_MS, float(self.MAX_PVT_SCORE), scores)
+    
+    def calculate_total_index_vectorized(self, metrics) -> np.ndarray:
+        """
+        Calculate the Total Neuro-Performance Index for many entries at once.
+        
+        Same formula, validation and rounding as calculate_total_index, but
+        computed with NumPy column operations instead of one call per row.
+        
+        Args:
+            metrics: DataFrame (or dict of array-likes) with the columns
+                sleep_score, pvt_score, diet_quality, recall_percent,
+                exercise_minutes and circadian_penalty
+        
+        Returns:
+            Integer array of total indices (0-100 scale)
+        
+        Raises:
+            KeyError: If required columns are missing
+            ValueError: If any metric value is out of its valid range or missing (NaN)
+        
+        Examples:
+            >>> scorer = NeuroScorer()
+            >>> scorer.calculate_total_index_vectorized({
+            ...     'sleep_score': [20.0, 10.0],
+            ...     'pvt_score': [18.0, 15.0],
+            ...     'diet_quality': [8, 5],
+            ...     'recall_percent': [80, 60],
+            ...     'exercise_minutes': [45, 0],
+            ...     'circadian_penalty': [2, 4]
+            ... })
+            array([86, 49])
+        """
+        missing_keys = set(self.TOTAL_INDEX_RANGES) - set(metrics.keys())
+        if missing_keys:
+            raise KeyError(f"Missing required metrics: {missing_keys}")
+        
+        columns = {}
+        for key, (low, high) in self.TOTAL_INDEX_RANGES.items():
+            values = np.asarray(metrics[key], dtype=float)
+            # Written as "not in range" so NaN (and blank nullable values) fail too
+            if not np.all((values >= low) & (values <= high)):
+                raise ValueError(f"{key} must be {low}-{high}")
+            columns[key] = values
+        
+        # Calculate component scores
+        diet_score = columns['diet_quality'] * 2
+        recall_score = columns['recall_percent'] * 0.3
+        
+        # Exercise score: Linear scaling (45 min = 10 points)
+        exercise_score = np.minimum(10, (columns['exercise_minutes'] / 45) * 10)
+        
+        # Sum in the scalar method's order so halves round the same way
+        total = (
+            columns['sleep_score'] +
+            columns['pvt_score'] +
+            diet_score +
+            recall_score +
+            exercise_score -
+            columns['circadian_penalty']
+        )
+        total = np.clip(total, 0, 100)
+        
+        # np.rint rounds half to even, matching the built-in round()
+        return np.rint(total).astype(int)
+    
     def get_performance_category(self, total_index: int) -> Tuple[str, str]:
         """
         Categorize performance based on total index score.
@@ -298,31 +480,26 @@ class NeuroScorer:
             >>> scorer.get_performance_category(92)
             ('Elite', 'Exceptional cognitive performance')
         """
-        if total_index >= 90:
-            return ("Elite", "Exceptional cognitive performance")
-        elif total_index >= 80:
-            return ("Excellent", "High cognitive efficiency")
-        elif total_index >= 70:
-            return ("Good", "Solid performance with room for improvement")
-        elif total_index >= 60:
-            return ("Fair", "Moderate performance - focus on key areas")
-        elif total_index >= 50:
-            return ("Below Average", "Significant improvement needed")
-        else:
-            return ("Poor", "Critical intervention required")
+        if total_index != total_index:  # NaN compares below every threshold
+            return self.CATEGORIES[0]
+        return self.CATEGORIES[bisect_right(self.CATEGORY_THRESHOLDS, total_index)]
+
+
+# Shared scorer for the convenience functions (it holds no per-call state)
+_DEFAULT_SCORER = NeuroScorer()
 
 
 # Convenience functions for quick calculations
 def quick_sleep_score(hours: float) -> float:
     """Quick wrapper for sleep score calculation."""
-    return NeuroScorer().calculate_sleep_score(hours)
+    return _DEFAULT_SCORER.calculate_sleep_score(hours)
 
 
 def quick_pvt_score(ms: int) -> float:
     """Quick wrapper for PVT score calculation."""
-    return NeuroScorer().calculate_pvt_score(ms)
+    return _DEFAULT_SCORER.calculate_pvt_score(ms)
 
 
 def quick_total_index(metrics: Dict[str, float]) -> int:
     """Quick wrapper for total index calculation."""
-    return NeuroScorer().calculate_total_index(metrics)
+    return _DEFAULT_SCORER.calculate_total_index(metrics)
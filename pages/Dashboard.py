@@ -5,9 +5,10 @@ High-end visualizations for Neuro Index with glassmorphism design.
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from string import Template
 from utils.db_data_manager import DataManager
 
 
@@ -19,12 +20,162 @@ VIOLET_500 = '#8B5CF6'    # Accent purple
 SLATE_400 = '#94a3b8'     # Text gray
 DEEP_SLATE = '#0B1120'    # Background
 
+# Chart builders below are cached on their inputs, so reruns that don't change
+# the data (e.g. toggling views) reuse the figures. Cached figures are shared
+# between reruns and sessions: callers must not mutate them.
+CHART_CACHE = dict(max_entries=16, show_spinner=False)
+
+# Comprehensive timeline input traces, drawn dotted in this order:
+# (column, legend name, color, divisor, hovertemplate). Columns divided for
+# visibility pass the raw value as customdata for the hover.
+TIMELINE_INPUT_TRACES = (
+    ('study_hours', 'Study Hours', EMERALD_500, 1,
+     '<b>Study Hours</b><br>%{y:.1f}h<extra></extra>'),
+    ('sleep_hours', 'Sleep Hours', BLUE_500, 1,
+     '<b>Sleep Hours</b><br>%{y:.1f}h<extra></extra>'),
+    ('screen_time_hours', 'Screen Time (hrs)', ROSE_500, 1,
+     '<b>Screen Time</b><br>%{y:.1f}h<extra></extra>'),
+    ('recall_percent', 'Recall % (÷10)', VIOLET_500, 10,
+     '<b>Recall</b><br>%{y:.1f} (×10 = %{customdata[0]}%)<extra></extra>'),
+    ('diet_quality', 'Diet Quality', '#FFD700', 1,
+     '<b>Diet Quality</b><br>%{y}/10<extra></extra>'),
+    ('exercise_minutes', 'Exercise (÷10 min)', '#FF6B6B', 10,
+     '<b>Exercise</b><br>%{y:.1f} (×10 = %{customdata[0]} min)<extra></extra>'),
+    ('sunlight_minutes', 'Sunlight (÷10 min)', '#FFA500', 10,
+     '<b>Sunlight</b><br>%{y:.1f} (×10 = %{customdata[0]} min)<extra></extra>'),
+)
+
+# Month labels for the timeline x axis ('%b' in the C locale)
+MONTH_ABBR = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+
+# HUD metric card markup, compiled once at import. Cards are joined into one
+# HTML block, so the markup must not contain blank lines (they end the block)
+METRIC_HUD_TEMPLATE = Template("""\
+<div class="metric-hud" style="--accent-color: ${color};">
+    <div class="metric-label">${label}</div>
+    <div class="metric-value">${value}<span style="font-size: 16px; color: #94a3b8;">${suffix}</span></div>
+</div>""")
+
+
+# Page stylesheet. Streamlit clears elements that a rerun doesn't emit, so
+# this is re-sent every run rather than injected once per session.
+DASHBOARD_CSS = """
+        <style>
+        /* Import premium fonts */
+        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap');
+        
+        /* Global background */
+        .main {
+            background-color: #0B1120;
+        }
+        
+        /* Glass card styling */
+        .glass-card {
+            background: rgba(30, 41, 59, 0.4);
+            border: 1px solid rgba(255, 255, 255, 0.08);
+            border-radius: 12px;
+            padding: 20px;
+            backdrop-filter: blur(10px);
+            margin-bottom: 20px;
+        }
+        
+        /* Typography */
+        h1, h2, h3 {
+            font-family: 'Inter', sans-serif;
+            background: linear-gradient(135deg, #ffffff 0%, #94a3b8 100%);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+            font-weight: 600;
+        }
+        
+        /* Metric cards HUD style */
+        .hud-grid {
+            display: grid;
+            grid-template-columns: repeat(6, 1fr);
+            gap: 1rem;
+            margin: 30px 0;
+        }
+        
+        @media (max-width: 640px) {
+            .hud-grid {
+                grid-template-columns: 1fr;
+            }
+        }
+        
+        .metric-hud {
+            background: rgba(30, 41, 59, 0.4);
+            border: 1px solid rgba(255, 255, 255, 0.08);
+            border-radius: 8px;
+            padding: 16px;
+            text-align: center;
+            position: relative;
+            overflow: hidden;
+        }
+        
+        .metric-hud::after {
+            content: '';
+            position: absolute;
+            bottom: 0;
+            left: 0;
+            right: 0;
+            height: 3px;
+            background: var(--accent-color);
+        }
+        
+        .metric-label {
+            font-family: 'Inter', sans-serif;
+            font-size: 12px;
+            color: #94a3b8;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            margin-bottom: 8px;
+        }
+        
+        .metric-value {
+            font-family: 'JetBrains Mono', monospace;
+            font-size: 28px;
+            font-weight: 600;
+            color: #ffffff;
+        }
+        
+        /* Streamlit overrides */
+        .stPlotlyChart {
+            background: transparent !important;
+        }
+        
+        /* Divider styling */
+        hr {
+            border: none;
+            height: 1px;
+            background: rgba(255, 255, 255, 0.08);
+            margin: 2rem 0;
+        }
+        </style>
+    """
+
+@st.cache_data(show_spinner=False)
+def load_dashboard_data(_data_manager, signature):
+    """
+    Load all entries, cached until the data signature changes.
+    
+    The signature doesn't change when an existing date is overwritten, so
+    callers that save entries must call load_dashboard_data.clear().
+    
+    Args:
+        _data_manager: DataManager to load from (not hashed)
+        signature: Data fingerprint from DataManager.get_signature()
+    """
+    return _data_manager.load_data()
+
 
 def normalize_to_percent(value, max_value):
     """Normalize a score to 0-100% for fair comparison."""
     return (value / max_value) * 100
 
 
+@st.cache_resource(**CHART_CACHE)
 def create_waterfall_chart(latest_entry):
     """
     Chart 1: The Score Waterfall (Truth Teller)
@@ -130,6 +281,7 @@ def create_waterfall_chart(latest_entry):
     return fig
 
 
+@st.cache_resource(**CHART_CACHE)
 def create_radar_chart(latest_entry):
     """
     Chart 2: The Neuro-Radar Hexagon
@@ -200,14 +352,46 @@ def show_dashboard():
     pass
 
 
-def create_grind_vs_growth_timeline(df, days=30):
+def prepare_timeline_window(df, days=30):
+    """
+    Slice the data to the timeline window shared by the timeline charts.
+    
+    Orders oldest first, keeps the last N days by actual date (or all
+    available if less), and adds the derived date_str and
+    screen_time_hours columns once for every chart drawn from the window.
+    
+    Args:
+        df: DataFrame from DataManager.load_data() (newest first)
+        days: Number of days to show (14, 30, 60, 90)
+    """
+    if df.empty:
+        return df
+    
+    # load_data() already orders by date descending (dates are unique), so
+    # reversing is enough - no need to re-sort
+    df = df.iloc[::-1]
+    cutoff_date = df['date'].iat[-1] - pd.Timedelta(days=days-1)
+    # Dates are ascending here, so binary search for the window start
+    df = df.iloc[df['date'].searchsorted(cutoff_date, side='left'):]
+    # Same labels as dt.strftime('%b %d'), built from array lookups
+    # instead of one strftime call per row
+    dates = df['date'].dt
+    days_str = np.char.zfill(dates.day.to_numpy().astype('U2'), 2)
+    date_str = np.char.add(np.char.add(MONTH_ABBR[dates.month.to_numpy() - 1], ' '), days_str)
+    return df.assign(
+        date_str=date_str,
+        screen_time_hours=df['screen_time_minutes'] / 60
+    )
+
+
+@st.cache_resource(**CHART_CACHE)
+def create_grind_vs_growth_timeline(df):
     """
     Chart 3: "Grind vs. Growth" Timeline
     Dual axis: Study vs Screen Time (bars) + Total Index (line)
     
     Args:
-        df: DataFrame with data
-        days: Number of days to show (14, 30, 60, 90)
+        df: Timeline window from prepare_timeline_window()
     """
     if df.empty or len(df) < 2:
         fig = go.Figure()
@@ -225,17 +409,6 @@ def create_grind_vs_growth_timeline(df, days=30):
         )
         return fig
     
-    # Sort by date
-    df = df.sort_values('date')
-    
-    # Filter to last N days by actual date (or all available if less)
-    max_date = df['date'].max()
-    cutoff_date = max_date - pd.Timedelta(days=days-1)
-    df = df[df['date'] >= cutoff_date]
-    
-    df['date_str'] = df['date'].dt.strftime('%b %d')
-    df['screen_time_hours'] = df['screen_time_minutes'] / 60
-    
     fig = go.Figure()
     
     # Bar: Study Hours (Green)
@@ -320,14 +493,14 @@ def create_grind_vs_growth_timeline(df, days=30):
     return fig
 
 
-def create_cognitive_roi_trend(df, days=30):
+@st.cache_resource(**CHART_CACHE)
+def create_cognitive_roi_trend(df):
     """
     Chart 4: Cognitive ROI Trend
     Line chart showing ROI over time, colored by sleep hours
     
     Args:
-        df: DataFrame with data
-        days: Number of days to show (14, 30, 60, 90)
+        df: Timeline window from prepare_timeline_window()
     """
     if df.empty or len(df) < 2:
         fig = go.Figure()
@@ -345,14 +518,6 @@ def create_cognitive_roi_trend(df, days=30):
         )
         return fig
     
-    df = df.sort_values('date')
-    
-    # Filter to last N days (or all available if less)
-    if len(df) > days:
-        df = df.tail(days)
-    
-    df['date_str'] = df['date'].dt.strftime('%b %d')
-    
     # Create figure
     fig = go.Figure()
     
@@ -409,14 +574,14 @@ def create_cognitive_roi_trend(df, days=30):
     return fig
 
 
-def create_comprehensive_timeline(df, days=30):
+@st.cache_resource(**CHART_CACHE)
+def create_comprehensive_timeline(df):
     """
     Chart 5: Comprehensive Multi-Metric Timeline
     Shows all user inputs and calculated indices over time
     
     Args:
-        df: DataFrame with data
-        days: Number of days to show (14, 30, 60, 90)
+        df: Timeline window from prepare_timeline_window()
     """
     if df.empty or len(df) < 2:
         fig = go.Figure()
@@ -434,111 +599,36 @@ def create_comprehensive_timeline(df, days=30):
         )
         return fig
     
-    # Sort by date
-    df = df.sort_values('date')
-    
-    # Filter to last N days by actual date (or all available if less)
-    max_date = df['date'].max()
-    cutoff_date = max_date - pd.Timedelta(days=days-1)
-    df = df[df['date'] >= cutoff_date]
-    
-    df['date_str'] = df['date'].dt.strftime('%b %d')
-    
-    fig = go.Figure()
-    
-    # User Input Metrics (BOLD lines, semi-transparent)
-    # User Input Metrics (DOTTED LINES)
-    # Study Hours
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['study_hours'],
-        name='Study Hours',
-        mode='lines',
-        line=dict(color=EMERALD_500, width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Study Hours</b><br>%{y:.1f}h<extra></extra>'
-    ))
-    
-    # Sleep Hours
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['sleep_hours'],
-        name='Sleep Hours',
-        mode='lines',
-        line=dict(color=BLUE_500, width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Sleep Hours</b><br>%{y:.1f}h<extra></extra>'
-    ))
-    
-    # Screen Time (converted to hours)
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['screen_time_minutes'] / 60,
-        name='Screen Time (hrs)',
-        mode='lines',
-        line=dict(color=ROSE_500, width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Screen Time</b><br>%{y:.1f}h<extra></extra>'
-    ))
-    
-    # Recall Percent (scaled down for visibility)
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['recall_percent'] / 10,  # Scale down from 0-100 to 0-10
-        name='Recall % (÷10)',
-        mode='lines',
-        line=dict(color=VIOLET_500, width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Recall</b><br>%{y:.1f} (×10 = ' + df['recall_percent'].astype(str) + '%)<extra></extra>'
-    ))
-    
-    # Diet Quality
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['diet_quality'],
-        name='Diet Quality',
-        mode='lines',
-        line=dict(color='#FFD700', width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Diet Quality</b><br>%{y}/10<extra></extra>'
-    ))
-    
-    # Exercise Minutes (scaled down)
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['exercise_minutes'] / 10,  # Scale down for visibility
-        name='Exercise (÷10 min)',
-        mode='lines',
-        line=dict(color='#FF6B6B', width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Exercise</b><br>%{y:.1f} (×10 = ' + df['exercise_minutes'].astype(str) + ' min)<extra></extra>'
-    ))
-    
-    # Sunlight Minutes (scaled down)
-    fig.add_trace(go.Scatter(
-        x=df['date_str'],
-        y=df['sunlight_minutes'] / 10,  # Scale down for visibility
-        name='Sunlight (÷10 min)',
-        mode='lines',
-        line=dict(color='#FFA500', width=2.5, dash='dot'),
-        opacity=0.7,
-        hovertemplate='<b>Sunlight</b><br>%{y:.1f} (×10 = ' + df['sunlight_minutes'].astype(str) + ' min)<extra></extra>'
-    ))
+    # User Input Metrics (DOTTED LINES), scaled ones carry the raw value
+    traces = [
+        go.Scatter(
+            x=df['date_str'],
+            y=df[column] if divisor == 1 else df[column] / divisor,
+            name=name,
+            mode='lines',
+            line=dict(color=color, width=2.5, dash='dot'),
+            opacity=0.7,
+            customdata=None if divisor == 1 else df[[column]].to_numpy(),
+            hovertemplate=hovertemplate
+        )
+        for column, name, color, divisor, hovertemplate in TIMELINE_INPUT_TRACES
+    ]
     
     # Calculated Metrics (SOLID BOLD LINES - very prominent)
     # Total Index (most prominent - cyan solid)
-    fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=df['date_str'],
         y=df['total_index'] / 10,  # Scale down from 0-100 to 0-10
         name='Total Index (÷10)',
         mode='lines+markers',
         line=dict(color='#00F0FF', width=6, dash='solid'),
         marker=dict(size=10, color='#00F0FF', symbol='diamond', line=dict(color='#ffffff', width=1.5)),
-        hovertemplate='<b>Total Index</b><br>%{y:.1f} (×10 = ' + df['total_index'].astype(str) + ')<extra></extra>'
+        customdata=df[['total_index']].to_numpy(),
+        hovertemplate='<b>Total Index</b><br>%{y:.1f} (×10 = %{customdata[0]})<extra></extra>'
     ))
     
     # Cognitive ROI (bold - purple solid)
-    fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=df['date_str'],
         y=df['cognitive_roi'],
         name='Cognitive ROI',
@@ -548,6 +638,8 @@ def create_comprehensive_timeline(df, days=30):
         hovertemplate='<b>Cognitive ROI</b><br>%{y:.2f}<extra></extra>'
     ))
     
+    # Build the figure in one go rather than validating N add_trace calls
+    fig = go.Figure(data=traces)
     fig.update_layout(
         title={
             'text': "📊 Comprehensive Metrics Timeline",
@@ -587,135 +679,14 @@ def create_comprehensive_timeline(df, days=30):
     return fig
 
 
-def show_dashboard():
-    """Main dashboard display function - called from app.py."""
-    # Premium SaaS dark mode styling with glassmorphism
-    st.markdown("""
-        <style>
-        /* Import premium fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap');
-        
-        /* Global background */
-        .main {
-            background-color: #0B1120;
-        }
-        
-        /* Glass card styling */
-        .glass-card {
-            background: rgba(30, 41, 59, 0.4);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            border-radius: 12px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-            margin-bottom: 20px;
-        }
-        
-        /* Typography */
-        h1, h2, h3 {
-            font-family: 'Inter', sans-serif;
-            background: linear-gradient(135deg, #ffffff 0%, #94a3b8 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            font-weight: 600;
-        }
-        
-        /* Metric cards HUD style */
-        .metric-hud {
-            background: rgba(30, 41, 59, 0.4);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            border-radius: 8px;
-            padding: 16px;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .metric-hud::after {
-            content: '';
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            height: 3px;
-            background: var(--accent-color);
-        }
-        
-        .metric-label {
-            font-family: 'Inter', sans-serif;
-            font-size: 12px;
-            color: #94a3b8;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 8px;
-        }
-        
-        .metric-value {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 28px;
-            font-weight: 600;
-            color: #ffffff;
-        }
-        
-        /* Streamlit overrides */
-        .stPlotlyChart {
-            background: transparent !important;
-        }
-        
-        /* Divider styling */
-        hr {
-            border: none;
-            height: 1px;
-            background: rgba(255, 255, 255, 0.08);
-            margin: 2rem 0;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    # Header
-    today = datetime.now().strftime('%B %d, %Y')
-    st.title("📊 Neuro Index Dashboard")
-    st.markdown(f"<p style='font-family: Inter, sans-serif; color: #94a3b8; font-size: 14px;'>Real-time performance insights • {today}</p>", unsafe_allow_html=True)
-    
-    # Load data
-    data_manager = DataManager("neuro_logs.csv")
-    df = data_manager.load_data()
-    
-    if df.empty:
-        st.warning("⚠️ No data available. Please add entries from the main page first.")
-        st.stop()
-    
-    # Get latest entry
-    latest = df.iloc[0]
-    
-    # Custom HUD-style metrics
-    st.markdown("<div style='margin: 30px 0;'>", unsafe_allow_html=True)
-    
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    metrics_data = [
-        ("Total Index", f"{latest.get('total_index', 0)}", "/100", BLUE_500, col1),
-        ("Study", f"{latest.get('study_score', 0)}", "/30", EMERALD_500, col2),
-        ("Recall", f"{latest.get('recall_score', 0)}", "/20", VIOLET_500, col3),
-        ("Sleep", f"{latest.get('sleep_score', 0)}", "/20", BLUE_500, col4),
-        ("Diet", f"{latest.get('diet_score', 0)}", "/20", EMERALD_500, col5),
-        ("Exercise", f"{latest.get('exercise_score', 0)}", "/10", ROSE_500, col6),
-    ]
-    
-    for label, value, suffix, color, col in metrics_data:
-        with col:
-            st.markdown(f"""
-                <div class="metric-hud" style="--accent-color: {color};">
-                    <div class="metric-label">{label}</div>
-                    <div class="metric-value">{value}<span style="font-size: 16px; color: #94a3b8;">{suffix}</span></div>
-                </div>
-            """, unsafe_allow_html=True)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
-    
-    st.divider()
+@st.fragment
+def render_time_series_section(df):
+    """
+    Render the Grind vs Growth and Cognitive ROI timelines.
     
-    # Row 1: Time Series Intelligence
+    Runs as a fragment so changing the duration selector reruns only
+    this section instead of the whole dashboard.
+    """
     col_header, col_selector = st.columns([3, 1])
     with col_header:
         st.subheader("📈 Time Series Intelligence")
@@ -730,23 +701,32 @@ def show_dashboard():
     
     st.markdown(f"<p style='font-family: Inter, sans-serif; color: #94a3b8; font-size: 12px; margin-top: -10px;'>Showing last {days_option} days (or all available data)</p>", unsafe_allow_html=True)
     
+    # One window for both charts
+    window = prepare_timeline_window(df, days=days_option)
+    
     col_timeline, col_roi = st.columns(2)
     
     with col_timeline:
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        grind_growth = create_grind_vs_growth_timeline(df, days=days_option)
+        grind_growth = create_grind_vs_growth_timeline(window)
         st.plotly_chart(grind_growth, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col_roi:
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        roi_trend = create_cognitive_roi_trend(df, days=days_option)
+        roi_trend = create_cognitive_roi_trend(window)
         st.plotly_chart(roi_trend, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def render_comprehensive_timeline_section(df):
+    """
+    Render the all-metrics timeline.
     
-    # Row 2: Comprehensive Metrics Timeline (MOVED BEFORE SCORE COMPOSITION)
-    st.divider()
-    
+    Runs as a fragment so changing the duration selector reruns only
+    this section instead of the whole dashboard.
+    """
     col_header2, col_selector2 = st.columns([3, 1])
     with col_header2:
         st.subheader("📊 All Metrics Timeline")
@@ -762,9 +742,63 @@ def show_dashboard():
     st.markdown(f"<p style='font-family: Inter, sans-serif; color: #94a3b8; font-size: 12px; margin-top: -10px;'>All user inputs + calculated indices • Last {days_option2} days</p>", unsafe_allow_html=True)
     
     st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    comprehensive = create_comprehensive_timeline(df, days=days_option2)
+    comprehensive = create_comprehensive_timeline(prepare_timeline_window(df, days=days_option2))
     st.plotly_chart(comprehensive, use_container_width=True)
     st.markdown('</div>', unsafe_allow_html=True)
+
+
+def show_dashboard(data_manager=None):
+    """
+    Main dashboard display function - called from app.py.
+    
+    Args:
+        data_manager: Shared DataManager (a new one is created if omitted)
+    """
+    # Premium SaaS dark mode styling with glassmorphism
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+    
+    # Header
+    today = datetime.now().strftime('%B %d, %Y')
+    st.title("📊 Neuro Index Dashboard")
+    st.markdown(f"<p style='font-family: Inter, sans-serif; color: #94a3b8; font-size: 14px;'>Real-time performance insights • {today}</p>", unsafe_allow_html=True)
+    
+    # Load data
+    if data_manager is None:
+        data_manager = DataManager()
+    df = load_dashboard_data(data_manager, data_manager.get_signature())
+    
+    if df.empty:
+        st.warning("⚠️ No data available. Please add entries from the main page first.")
+        st.stop()
+    
+    # Get latest entry as a plain dict for cheap repeated lookups
+    latest = df.head(1).to_dict('records')[0]
+    
+    # Custom HUD-style metrics
+    metrics_data = [
+        ("Total Index", f"{latest.get('total_index', 0)}", "/100", BLUE_500),
+        ("Study", f"{latest.get('study_score', 0)}", "/30", EMERALD_500),
+        ("Recall", f"{latest.get('recall_score', 0)}", "/20", VIOLET_500),
+        ("Sleep", f"{latest.get('sleep_score', 0)}", "/20", BLUE_500),
+        ("Diet", f"{latest.get('diet_score', 0)}", "/20", EMERALD_500),
+        ("Exercise", f"{latest.get('exercise_score', 0)}", "/10", ROSE_500),
+    ]
+    
+    # Lay the cards out with a CSS grid and emit the whole row in one call
+    cards_html = ''.join(
+        METRIC_HUD_TEMPLATE.substitute(label=label, value=value, suffix=suffix, color=color)
+        for label, value, suffix, color in metrics_data
+    )
+    st.markdown(f'<div class="hud-grid">{cards_html}</div>', unsafe_allow_html=True)
+    
+    st.divider()
+    
+    # Row 1: Time Series Intelligence
+    render_time_series_section(df)
+    
+    # Row 2: Comprehensive Metrics Timeline (MOVED BEFORE SCORE COMPOSITION)
+    st.divider()
+    render_comprehensive_timeline_section(df)
     
     # Row 3: Score Composition
     st.divider()
@@ -3,6 +3,7 @@ Populate UPSC Neuro-OS with 4 months of dummy data
 Run this script to generate realistic test data.
 """
 
+import atexit
 from utils.data_manager import DataManager
 
 def main():
@@ -12,6 +13,9 @@ def main():
     # Initialize data manager
     data_manager = DataManager("upsc_logs.csv")
     
+    # Don't lose buffered entries on interpreter shutdown
+    atexit.register(data_manager.flush)
+    
     # Generate 120 days (4 months) of dummy data
     data_manager.generate_dummy_data(days=120)
     
@@ -0,0 +1,130 @@
+"""
+Tests for the Parquet-backed DataManager.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from modules.data_manager import DataManager, DailyEntry
+
+
+class DataManagerTest(unittest.TestCase):
+    """Saves go through the background writer and the pending log."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_file = Path(self.tmp.name) / "daily_logs.parquet"
+        self.dm = DataManager(self.data_file)
+
+    def tearDown(self):
+        self.dm.flush()
+        self.tmp.cleanup()
+
+    def test_save_flush_load_round_trip(self):
+        self.assertTrue(self.dm.save_entries([
+            DailyEntry(date='2025-11-28', sleep_hours=7.3, sleep_quality=8, total_index=81),
+            {'date': '2025-11-29', 'sleep_hours': 6.5, 'sleep_quality': 6,
+             'study_hours': 5.5, 'bedtime': '23:15', 'total_index': 74}
+        ]))
+        self.dm.flush()
+
+        df = self.dm.load_data()
+
+        self.assertEqual(
+            df['date'].tolist(),
+            [pd.Timestamp('2025-11-29'), pd.Timestamp('2025-11-28')]
+        )
+        self.assertEqual(df['sleep_hours'].tolist(), [6.5, 7.3])
+        self.assertEqual(df['total_index'].tolist(), [74, 81])
+        self.assertEqual(df['bedtime'].tolist(), ['23:15', ''])
+        self.assertTrue(pd.isna(df['study_hours'].iat[1]))
+
+    def test_overwrite_existing_date(self):
+        self.dm.save_entry({'date': '2025-11-29', 'sleep_hours': 6.0,
+                            'sleep_quality': 5, 'total_index': 60})
+        self.dm.flush()
+        self.dm.save_entry({'date': '2025-11-29', 'sleep_hours': 8.0,
+                            'sleep_quality': 9, 'total_index': 90})
+        self.dm.flush()
+
+        df = self.dm.load_data()
+
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df['sleep_hours'].iat[0], 8.0)
+        self.assertEqual(df['total_index'].iat[0], 90)
+
+    def test_compact(self):
+        self.dm.save_entries(self.dm.get_mock_data(10))
+        self.dm.flush()
+        before = self.dm.load_data()
+        self.assertTrue(self.dm.pending_file.exists())
+
+        self.assertTrue(self.dm.compact())
+
+        self.assertFalse(self.dm.pending_file.exists())
+        self.assertTrue(self.data_file.exists())
+        pd.testing.assert_frame_equal(self.dm.load_data(), before)
+
+        # Saves after compaction still replace the compacted rows
+        newest = before['date'].iat[0]
+        self.dm.save_entry({'date': newest, 'sleep_hours': 4.0, 'sleep_quality': 2})
+        self.dm.flush()
+        df = self.dm.load_data()
+        self.assertEqual(len(df), 10)
+        self.assertEqual(df['sleep_hours'].iat[0], 4.0)
+
+    def assert_statistics_updated_in_place(self):
+        # The writer folded the save into the running statistics rather than
+        # failing (a failed update only shows up as a rebuild on next read)
+        self.dm.flush()
+        self.assertIsNotNone(self.dm._stats)
+        self.assertEqual(self.dm._stats_version, self.dm._versions())
+
+    def assert_statistics_match_recompute(self):
+        # A fresh manager has no running statistics and scans the files
+        self.assertEqual(
+            self.dm.get_statistics(), DataManager(self.data_file).get_statistics()
+        )
+
+    def test_entry_without_optional_columns(self):
+        self.dm.save_entries(self.dm.get_mock_data(5))
+        self.dm.get_statistics()  # Build running statistics to update incrementally
+
+        self.assertTrue(self.dm.save_entry(
+            {'date': '2030-01-01', 'sleep_hours': 9.0, 'sleep_quality': 7}
+        ))
+        self.assert_statistics_updated_in_place()
+
+        df = self.dm.load_data()
+        self.assertEqual(len(df), 6)
+        self.assertEqual(df['date'].iat[0], pd.Timestamp('2030-01-01'))
+        self.assertTrue(pd.isna(df['total_index'].iat[0]))
+        self.assert_statistics_match_recompute()
+
+    def test_statistics_follow_saves(self):
+        self.dm.save_entries(self.dm.get_mock_data(5))
+        self.dm.get_statistics()
+
+        # New date: folded into the running statistics
+        self.dm.save_entry({'date': '2030-01-01', 'sleep_hours': 8.0,
+                            'sleep_quality': 9, 'study_hours': 6.0, 'total_index': 99})
+        self.assert_statistics_updated_in_place()
+        stats = self.dm.get_statistics()
+        self.assertEqual(stats['total_entries'], 6)
+        self.assertEqual(stats['best_day'], '2030-01-01')
+        self.assert_statistics_match_recompute()
+
+        # Existing date: statistics are rebuilt
+        self.dm.save_entry({'date': '2030-01-01', 'sleep_hours': 3.0,
+                            'sleep_quality': 2, 'total_index': 10})
+        stats = self.dm.get_statistics()
+        self.assertEqual(stats['total_entries'], 6)
+        self.assertNotEqual(stats['best_day'], '2030-01-01')
+        self.assert_statistics_match_recompute()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the NeuroScorer scoring engine.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from modules.scoring_engine import NeuroScorer
+
+
+class TotalIndexVectorizedTest(unittest.TestCase):
+    """calculate_total_index_vectorized must match calculate_total_index."""
+
+    def setUp(self):
+        self.scorer = NeuroScorer()
+
+    def test_matches_scalar_on_random_rows(self):
+        rng = np.random.default_rng(0)
+        n = 20_000
+        metrics = {
+            'sleep_score': rng.integers(0, 201, n) / 10,
+            'pvt_score': rng.integers(0, 201, n) / 10,
+            'diet_quality': rng.integers(0, 11, n),
+            'recall_percent': rng.integers(0, 101, n),
+            'exercise_minutes': rng.integers(0, 121, n),
+            'circadian_penalty': rng.integers(0, 11, n)
+        }
+
+        vectorized = self.scorer.calculate_total_index_vectorized(metrics)
+
+        for i in range(n):
+            row = {key: values[i].item() for key, values in metrics.items()}
+            self.assertEqual(
+                vectorized[i], self.scorer.calculate_total_index(row), row
+            )
+
+    def test_rounding_tie(self):
+        # Sums to 48.5 up to float error, so the result depends on term order
+        row = {
+            'sleep_score': 3.3,
+            'pvt_score': 19.1,
+            'diet_quality': 9,
+            'recall_percent': 27,
+            'exercise_minutes': 96,
+            'circadian_penalty': 10
+        }
+
+        vectorized = self.scorer.calculate_total_index_vectorized(
+            {key: [value] for key, value in row.items()}
+        )
+
+        self.assertEqual(self.scorer.calculate_total_index(row), 49)
+        self.assertEqual(vectorized.tolist(), [49])
+
+    def test_nan_raises_like_scalar(self):
+        row = {
+            'sleep_score': np.nan,
+            'pvt_score': 18.0,
+            'diet_quality': 8,
+            'recall_percent': 80,
+            'exercise_minutes': 45,
+            'circadian_penalty': 2
+        }
+
+        with self.assertRaises(ValueError):
+            self.scorer.calculate_total_index(row)
+        with self.assertRaises(ValueError):
+            self.scorer.calculate_total_index_vectorized(
+                {key: [value] for key, value in row.items()}
+            )
+
+    def test_blank_nullable_column_raises(self):
+        metrics = pd.DataFrame({
+            'sleep_score': [20.0, 10.0],
+            'pvt_score': [18.0, 15.0],
+            'diet_quality': pd.array([8, None], dtype='Int8'),
+            'recall_percent': [80, 60],
+            'exercise_minutes': [45, 0],
+            'circadian_penalty': [2, 4]
+        })
+
+        with self.assertRaises(ValueError):
+            self.scorer.calculate_total_index_vectorized(metrics)
+
+
+if __name__ == '__main__':
+    unittest.main()
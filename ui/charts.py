@@ -9,15 +9,13 @@ Date: November 29, 2025
 """
 
 import pandas as pd
+import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import Dict, List, Tuple
 import numpy as np
 
 # Import color constants
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
 from config.settings import NEON_GREEN, CYBER_CYAN, ELECTRIC_PURPLE, ACCENT_PINK, DEEP_BLUE
 
 
@@ -33,6 +31,9 @@ CHART_COLORS = {
     'dark_gray': '#1A1A2E'
 }
 
+# Fewer entries than this get a placeholder instead of trend charts
+MIN_CHART_ENTRIES = 3
+
 
 def get_neon_theme() -> Dict:
     """
@@ -84,10 +85,16 @@ def get_default_axis_style() -> Dict:
     }
 
 
+@st.cache_resource(max_entries=16, show_spinner=False)
 def render_dashboard_charts(df: pd.DataFrame) -> Tuple[go.Figure, go.Figure, go.Figure]:
     """
     Create three main dashboard charts with neon styling.
     
+    Figures are cached on the DataFrame's contents and shared between
+    reruns, so callers must not mutate the returned figures. With fewer
+    than MIN_CHART_ENTRIES entries a single placeholder figure is returned
+    for all three charts instead of building trend lines.
+    
     Args:
         df: DataFrame with daily log data
     
@@ -109,10 +116,16 @@ def render_dashboard_charts(df: pd.DataFrame) -> Tuple[go.Figure, go.Figure, go.
         empty_fig = create_empty_chart("No data available")
         return empty_fig, empty_fig, empty_fig
     
-    # Ensure date column is datetime
+    # Too few points for a trend: skip building the full figures
+    if len(df) < MIN_CHART_ENTRIES:
+        placeholder_fig = create_empty_chart(
+            f"Log at least {MIN_CHART_ENTRIES} days to see trends"
+        )
+        return placeholder_fig, placeholder_fig, placeholder_fig
+    
+    # Ensure date column is datetime (without mutating the caller's frame)
     if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
+        df = df.assign(date=pd.to_datetime(df['date'])).sort_values('date')
     
     # Create three charts
     bio_rhythm_fig = create_bio_rhythm_chart(df)
@@ -502,5 +515,6 @@ __all__ = [
     'create_focus_chart',
     'create_cognitive_chart',
     'create_empty_chart',
-    'get_neon_theme'
+    'get_neon_theme',
+    'MIN_CHART_ENTRIES'
 ]
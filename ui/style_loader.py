@@ -10,9 +10,35 @@ Date: November 29, 2025
 
 import streamlit as st
 from pathlib import Path
+from string import Template
 from typing import Optional
 
 
+# HTML templates for the convenience builders, compiled once at import
+_METRIC_TEMPLATE = Template('''
+    <div class="glass-card" style="text-align: center; margin: 10px 0;">
+        <div class="neon-text-cyan" style="font-size: 0.9rem; margin-bottom: 8px;">${label}</div>
+        <div class="neon-text" style="font-size: 2rem; font-weight: 700;">${value}</div>
+        ${delta}
+    </div>
+    ''')
+_METRIC_DELTA_TEMPLATE = Template('<div style="color: #39FF14; font-size: 0.9rem;">${delta}</div>')
+_HEADER_TEMPLATE = Template('''
+    <div class="fade-in" style="text-align: center; margin-bottom: 30px;">
+        <h1 class="neon-text" style="font-size: 3rem; margin-bottom: 0;">🧠 ${title}</h1>
+        ${subtitle}
+    </div>
+    ''')
+_SUBTITLE_TEMPLATE = Template('<div class="neon-subtitle" style="margin-top: 8px; font-size: 1.1rem;">${subtitle}</div>')
+
+
+@st.cache_resource(show_spinner=False)
+def _read_css(css_path: str) -> str:
+    """Read a CSS file once per process (shared, not copied per rerun)."""
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 def load_css(css_file: Optional[Path] = None) -> None:
     """
     Load and inject CSS styles into the Streamlit app.
@@ -31,6 +57,7 @@ def load_css(css_file: Optional[Path] = None) -> None:
     Notes:
         - Call this once at the top of your Streamlit app
         - CSS is scoped to the current session
+        - File contents are cached; only the <style> element is re-sent
         - Supports glassmorphism, neon effects, and dark mode
     """
     # Default to assets/style.css
@@ -44,9 +71,8 @@ def load_css(css_file: Optional[Path] = None) -> None:
         return
     
     try:
-        # Read CSS content
-        with open(css_file, 'r', encoding='utf-8') as f:
-            css_content = f.read()
+        # Read CSS content (cached, so reruns skip the disk read)
+        css_content = _read_css(str(css_file))
         
         # Inject CSS into Streamlit
         st.markdown(
@@ -199,16 +225,8 @@ def styled_metric(label: str, value: str, delta: Optional[str] = None) -> str:
         >>> html = styled_metric("Sleep Score", "20/20", "+2")
         >>> inject_custom_html(html)
     """
-    delta_html = f'<div style="color: #39FF14; font-size: 0.9rem;">{delta}</div>' if delta else ''
-    
-    html = f'''
-    <div class="glass-card" style="text-align: center; margin: 10px 0;">
-        <div class="neon-text-cyan" style="font-size: 0.9rem; margin-bottom: 8px;">{label}</div>
-        <div class="neon-text" style="font-size: 2rem; font-weight: 700;">{value}</div>
-        {delta_html}
-    </div>
-    '''
-    return html
+    delta_html = _METRIC_DELTA_TEMPLATE.substitute(delta=delta) if delta else ''
+    return _METRIC_TEMPLATE.substitute(label=label, value=value, delta=delta_html)
 
 
 def create_header(title: str, subtitle: Optional[str] = None) -> str:
@@ -222,15 +240,8 @@ def create_header(title: str, subtitle: Optional[str] = None) -> str:
     Returns:
         HTML string for header
     """
-    subtitle_html = f'<div class="neon-subtitle" style="margin-top: 8px; font-size: 1.1rem;">{subtitle}</div>' if subtitle else ''
-    
-    html = f'''
-    <div class="fade-in" style="text-align: center; margin-bottom: 30px;">
-        <h1 class="neon-text" style="font-size: 3rem; margin-bottom: 0;">🧠 {title}</h1>
-        {subtitle_html}
-    </div>
-    '''
-    return html
+    subtitle_html = _SUBTITLE_TEMPLATE.substitute(subtitle=subtitle) if subtitle else ''
+    return _HEADER_TEMPLATE.substitute(title=title, subtitle=subtitle_html)
 
 
 # Export all public functions
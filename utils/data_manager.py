@@ -8,20 +8,24 @@ import json
 from pathlib import Path
 from datetime import datetime, time, timedelta, date
 from typing import Optional, Dict, Any
-from utils.scoring import calculate_total_index
+from utils.scoring import calculate_total_index, calculate_cognitive_roi
 
 
 class DataManager:
     """Manages saving and loading of daily productivity logs."""
     
-    def __init__(self, filepath: str = "upsc_logs.csv"):
+    def __init__(self, filepath: str = "upsc_logs.csv", buffer_size: int = 1):
         """
         Initialize DataManager.
         
         Args:
             filepath: Path to CSV file for storing logs
+            buffer_size: Number of saved entries to buffer before rewriting
+                the CSV (1 = write through on every save)
         """
         self.filepath = Path(filepath)
+        self.buffer_size = buffer_size
+        self._pending = []
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
@@ -57,13 +61,13 @@ class DataManager:
         """
         Save a daily entry to CSV.
         
+        Entries are buffered and written once buffer_size of them are pending.
+        
         Args:
             entry: Dictionary with all entry data
         """
-        df = pd.read_csv(self.filepath)
-        
         # Convert date to string if it's a date object
-        if isinstance(entry.get('date'), datetime):
+        if isinstance(entry.get('date'), date):
             entry['date'] = entry['date'].strftime('%Y-%m-%d')
         
         # Convert time objects to strings
@@ -72,22 +76,31 @@ class DataManager:
         if isinstance(entry.get('wake_time'), time):
             entry['wake_time'] = entry['wake_time'].strftime('%H:%M:%S')
         
-        # Check if entry for this date already exists
-        if entry['date'] in df['date'].values:
-            # Remove old entry and add new one
-            df = df[df['date'] != entry['date']]
-            df = pd.concat([df, pd.DataFrame([entry])], ignore_index=True)
-        else:
-            # Append new entry
-            df = pd.concat([df, pd.DataFrame([entry])], ignore_index=True)
+        self._pending.append(entry)
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered entries to CSV in a single rewrite."""
+        if not self._pending:
+            return
+        
+        # Later saves for the same date win
+        new_rows = pd.DataFrame(self._pending).drop_duplicates('date', keep='last')
+        
+        # Replace any existing entries for the buffered dates
+        df = pd.read_csv(self.filepath)
+        df = df[~df['date'].isin(new_rows['date'])]
+        df = pd.concat([df, new_rows], ignore_index=True)
         
         # Sort by date descending
         df['date'] = pd.to_datetime(df['date'])
         df = df.sort_values('date', ascending=False)
         df['date'] = df['date'].dt.strftime('%Y-%m-%d')
         
-        # Save to CSV
+        # Save to CSV, and only then drop the buffer so a failed write keeps it
         df.to_csv(self.filepath, index=False)
+        self._pending = []
     
     def load_data(self) -> pd.DataFrame:
         """
@@ -96,11 +109,35 @@ class DataManager:
         Returns:
             DataFrame with all entries
         """
+        self.flush()
         if not self.filepath.exists():
             return pd.DataFrame()
         
         df = pd.read_csv(self.filepath)
+        return self._convert_types(df)
+    
+    def load_recent(self, n: int = 10) -> pd.DataFrame:
+        """
+        Load the most recent entries from CSV.
         
+        The file is kept sorted newest-first by save_entry, so only the
+        first n rows need to be parsed.
+        
+        Args:
+            n: Number of entries to load
+        
+        Returns:
+            DataFrame with up to n entries, newest first
+        """
+        self.flush()
+        if not self.filepath.exists():
+            return pd.DataFrame()
+        
+        df = pd.read_csv(self.filepath, nrows=n)
+        return self._convert_types(df)
+    
+    def _convert_types(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert CSV string columns back to datetime/time objects."""
         if df.empty:
             return df
         
@@ -143,7 +180,6 @@ class DataManager:
         if df.empty:
             return None
         
-        df['date'] = pd.to_datetime(df['date'])
         target_date = pd.to_datetime(date)
         
         entry = df[df['date'] == target_date]
@@ -161,73 +197,82 @@ class DataManager:
         """
         np.random.seed(42)  # For reproducible results
         
+        # Buffer every generated day and write the CSV once at the end
+        buffer_size = self.buffer_size
+        self.buffer_size = days
+        
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days - 1)
         
-        for i in range(days):
-            current_date = start_date + timedelta(days=i)
-            
-            # Generate realistic values with some variation
-            study_hours = np.random.uniform(4.0, 9.0)
-            screen_time_minutes = int(np.random.uniform(30, 180))
-            recall_percent = np.random.uniform(65, 95)
-            sleep_hours = np.random.uniform(6.0, 8.5)
-            
-            # Bedtime variation (21:30 to 00:30)
-            bedtime_hour = np.random.randint(21, 24)
-            bedtime_minute = np.random.choice([0, 15, 30, 45])
-            if bedtime_hour == 24:
-                bedtime_hour = 0
-            bedtime = time(bedtime_hour, bedtime_minute)
-            
-            # Wake time variation (05:00 to 07:30)
-            wake_hour = np.random.randint(5, 8)
-            wake_minute = np.random.choice([0, 15, 30, 45])
-            if wake_hour == 8:
-                wake_minute = 0
-            wake_time = time(wake_hour, wake_minute)
-            
-            diet_quality = int(np.random.uniform(5, 10))
-            exercise_minutes = int(np.random.uniform(20, 90))
-            sunlight_minutes = int(np.random.uniform(15, 120))
-            cycle_day = int(np.random.uniform(1, 29))
-            
-            # Calculate scores
-            scores = calculate_total_index(
-                study_hours=study_hours,
-                recall_percent=recall_percent,
-                sleep_hours=sleep_hours,
-                diet_quality=diet_quality,
-                exercise_minutes=exercise_minutes,
-                bedtime=bedtime,
-                wake_time=wake_time,
-                screen_time_minutes=screen_time_minutes,
-                sunlight_minutes=sunlight_minutes
-            )
-            
-            # Calculate cognitive ROI
-            from utils.scoring import calculate_cognitive_roi
-            cognitive_roi = calculate_cognitive_roi(recall_percent, study_hours)
-            
-            # Create entry
-            entry = {
-                'date': current_date,
-                'study_hours': round(study_hours, 1),
-                'screen_time_minutes': screen_time_minutes,
-                'recall_percent': round(recall_percent, 1),
-                'sleep_hours': round(sleep_hours, 1),
-                'bedtime': bedtime,
-                'wake_time': wake_time,
-                'diet_quality': diet_quality,
-                'exercise_minutes': exercise_minutes,
-                'sunlight_minutes': sunlight_minutes,
-                'cycle_day': cycle_day,
-                'cognitive_roi': round(cognitive_roi, 2),
-                **scores
-            }
+        try:
+            for i in range(days):
+                current_date = start_date + timedelta(days=i)
+                
+                # Generate realistic values with some variation
+                study_hours = np.random.uniform(4.0, 9.0)
+                screen_time_minutes = int(np.random.uniform(30, 180))
+                recall_percent = np.random.uniform(65, 95)
+                sleep_hours = np.random.uniform(6.0, 8.5)
+                
+                # Bedtime variation (21:30 to 00:30)
+                bedtime_hour = np.random.randint(21, 24)
+                bedtime_minute = np.random.choice([0, 15, 30, 45])
+                if bedtime_hour == 24:
+                    bedtime_hour = 0
+                bedtime = time(bedtime_hour, bedtime_minute)
+                
+                # Wake time variation (05:00 to 07:30)
+                wake_hour = np.random.randint(5, 8)
+                wake_minute = np.random.choice([0, 15, 30, 45])
+                if wake_hour == 8:
+                    wake_minute = 0
+                wake_time = time(wake_hour, wake_minute)
+                
+                diet_quality = int(np.random.uniform(5, 10))
+                exercise_minutes = int(np.random.uniform(20, 90))
+                sunlight_minutes = int(np.random.uniform(15, 120))
+                cycle_day = int(np.random.uniform(1, 29))
+                
+                # Calculate scores
+                scores = calculate_total_index(
+                    study_hours=study_hours,
+                    recall_percent=recall_percent,
+                    sleep_hours=sleep_hours,
+                    diet_quality=diet_quality,
+                    exercise_minutes=exercise_minutes,
+                    bedtime=bedtime,
+                    wake_time=wake_time,
+                    screen_time_minutes=screen_time_minutes,
+                    sunlight_minutes=sunlight_minutes
+                )
+                
+                # Calculate cognitive ROI
+                cognitive_roi = calculate_cognitive_roi(recall_percent, study_hours)
+                
+                # Create entry
+                entry = {
+                    'date': current_date,
+                    'study_hours': round(study_hours, 1),
+                    'screen_time_minutes': screen_time_minutes,
+                    'recall_percent': round(recall_percent, 1),
+                    'sleep_hours': round(sleep_hours, 1),
+                    'bedtime': bedtime,
+                    'wake_time': wake_time,
+                    'diet_quality': diet_quality,
+                    'exercise_minutes': exercise_minutes,
+                    'sunlight_minutes': sunlight_minutes,
+                    'cycle_day': cycle_day,
+                    'cognitive_roi': round(cognitive_roi, 2),
+                    **scores
+                }
+                
+                # Save entry
+                self.save_entry(entry)
             
-            # Save entry
-            self.save_entry(entry)
+            self.flush()
+        finally:
+            # Restore write-through even if generating or writing failed
+            self.buffer_size = buffer_size
         
         print(f"✅ Generated {days} days of dummy data from {start_date} to {end_date}")
 
@@ -6,11 +6,16 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, time, timedelta, date
 from typing import Optional, Dict, Any
-from sqlalchemy import desc
+from sqlalchemy import desc, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from utils.database import get_session, DailyEntry, UserConfig
 from utils.scoring import calculate_total_index, calculate_cognitive_roi
 
 
+# Writable daily_entries columns (everything except the surrogate key)
+ENTRY_COLUMNS = [col.name for col in DailyEntry.__table__.columns if col.name != 'id']
+
+
 class DataManager:
     """Manages saving and loading of daily productivity logs using PostgreSQL."""
     
@@ -21,17 +26,55 @@ class DataManager:
         Args:
             filepath: Ignored (kept for compatibility with old CSV version)
         """
-        pass
+        # Upserts keyed on the unique date column, one per set of supplied
+        # columns. Built once each; SQLAlchemy reuses their compiled form.
+        self._upsert_stmts = {}
+    
+    def _upsert_stmt(self, columns):
+        """
+        Get the upsert statement for rows supplying the given columns.
+        
+        On conflict only the supplied columns are overwritten, so re-saving
+        a date keeps stored values for any column the entry leaves out.
+        
+        Args:
+            columns: Tuple of supplied column names (including 'date')
+        """
+        stmt = self._upsert_stmts.get(columns)
+        if stmt is None:
+            insert = pg_insert(DailyEntry.__table__)
+            stmt = self._upsert_stmts[columns] = insert.on_conflict_do_update(
+                index_elements=[DailyEntry.__table__.c.date],
+                set_={col: insert.excluded[col] for col in columns if col != 'date'}
+            )
+        return stmt
     
     def save_entry(self, entry: dict):
         """
         Save a daily entry to database.
         
+        Re-saving an existing date updates only the columns present in the
+        entry; new rows take the column defaults for any left out.
+        
         Args:
             entry: Dictionary with all entry data
         """
-        session = get_session()
-        try:
+        self.save_entries([entry])
+    
+    def save_entries(self, entries):
+        """
+        Save several daily entries in one transaction.
+        
+        Rows supplying the same columns go through one batched upsert, so
+        seeding many days costs one round trip instead of one session and
+        commit per entry.
+        
+        Args:
+            entries: Iterable of entry dictionaries (the last one wins per date)
+        """
+        # One parameter set per date: a batched upsert can't touch a row twice
+        rows = {}
+        for entry in entries:
             # Convert date to date object if it's datetime
             entry_date = entry.get('date')
             if isinstance(entry_date, datetime):
@@ -39,40 +82,24 @@ class DataManager:
             elif isinstance(entry_date, str):
                 entry_date = datetime.strptime(entry_date, '%Y-%m-%d').date()
             
-            # Check if entry for this date already exists
-            existing = session.query(DailyEntry).filter_by(date=entry_date).first()
-            
-            if existing:
-                # Update existing entry
-                for key, value in entry.items():
-                    if key != 'date' and hasattr(existing, key):
-                        setattr(existing, key, value)
-            else:
-                # Create new entry
-                new_entry = DailyEntry(
-                    date=entry_date,
-                    study_hours=entry['study_hours'],
-                    screen_time_minutes=entry['screen_time_minutes'],
-                    recall_percent=entry['recall_percent'],
-                    sleep_hours=entry['sleep_hours'],
-                    bedtime=entry['bedtime'],
-                    wake_time=entry['wake_time'],
-                    diet_quality=entry['diet_quality'],
-                    exercise_minutes=entry['exercise_minutes'],
-                    sunlight_minutes=entry.get('sunlight_minutes', 0),
-                    cycle_day=entry['cycle_day'],
-                    study_score=entry['study_score'],
-                    recall_score=entry['recall_score'],
-                    sleep_score=entry['sleep_score'],
-                    diet_score=entry['diet_score'],
-                    exercise_score=entry['exercise_score'],
-                    sunlight_score=entry.get('sunlight_score', 0),
-                    circadian_penalty=entry['circadian_penalty'],
-                    distraction_penalty=entry['distraction_penalty'],
-                    total_index=entry['total_index'],
-                    cognitive_roi=entry['cognitive_roi']
-                )
-                session.add(new_entry)
+            params = {key: value for key, value in entry.items() if key in ENTRY_COLUMNS}
+            params['date'] = entry_date
+            rows[entry_date] = params
+        
+        if not rows:
+            return
+        
+        # Rows supplying the same columns share a statement (usually all of them)
+        batches = {}
+        for params in rows.values():
+            columns = tuple(col for col in ENTRY_COLUMNS if col in params)
+            batches.setdefault(columns, []).append(params)
+        
+        session = get_session()
+        try:
+            # Insert or update the entry for each date, one statement per batch
+            for columns, batch in batches.items():
+                session.execute(self._upsert_stmt(columns), batch)
             
             session.commit()
         except Exception as e:
@@ -106,6 +133,44 @@ class DataManager:
         finally:
             session.close()
     
+    def load_recent(self, n: int = 10) -> pd.DataFrame:
+        """
+        Load the most recent entries from database.
+        
+        Args:
+            n: Number of entries to load
+        
+        Returns:
+            DataFrame with up to n entries, newest first
+        """
+        session = get_session()
+        try:
+            entries = session.query(DailyEntry).order_by(desc(DailyEntry.date)).limit(n).all()
+            
+            if not entries:
+                return pd.DataFrame()
+            
+            df = pd.DataFrame([entry.to_dict() for entry in entries])
+            df['date'] = pd.to_datetime(df['date'])
+            
+            return df
+        finally:
+            session.close()
+    
+    def get_signature(self) -> tuple:
+        """
+        Get a cheap fingerprint of the stored entries.
+        
+        Returns:
+            Tuple of (row count, highest id), usable as a cache key
+        """
+        session = get_session()
+        try:
+            count, max_id = session.query(func.count(DailyEntry.id), func.max(DailyEntry.id)).one()
+            return count, max_id
+        finally:
+            session.close()
+    
     def get_latest_entry(self) -> Optional[dict]:
         """
         Get the most recent entry.
@@ -120,6 +185,23 @@ class DataManager:
         finally:
             session.close()
     
+    def get_entry_by_date(self, entry_date: date) -> Optional[dict]:
+        """
+        Get entry for a specific date.
+        
+        Args:
+            entry_date: Date to look up
+        
+        Returns:
+            Dictionary with entry data, or None if not found
+        """
+        session = get_session()
+        try:
+            entry = session.query(DailyEntry).filter_by(date=entry_date).first()
+            return entry.to_dict() if entry else None
+        finally:
+            session.close()
+    
     def generate_dummy_data(self, days: int = 120):
         """
         Generate dummy data for testing (sequential dates from today backwards).
@@ -132,6 +214,7 @@ class DataManager:
         
         print(f"Generating {days} days of dummy data...")
         
+        entries = []
         for i in range(days):
             current_date = start_date + timedelta(days=i)
             
@@ -175,7 +258,7 @@ class DataManager:
             cognitive_roi = calculate_cognitive_roi(recall_percent, study_hours)
             
             # Create entry
-            entry = {
+            entries.append({
                 'date': current_date,
                 'study_hours': round(study_hours, 1),
                 'screen_time_minutes': screen_time_minutes,
@@ -189,10 +272,10 @@ class DataManager:
                 'cycle_day': cycle_day,
                 'cognitive_roi': round(cognitive_roi, 2),
                 **scores
-            }
-            
-            # Save entry
-            self.save_entry(entry)
+            })
+        
+        # Save all entries at once
+        self.save_entries(entries)
         
         print(f"✅ Generated {days} days of dummy data from {start_date} to {end_date}")
 